@@ -9,14 +9,14 @@ which can be invoked directly from main.py / demo.py.
 import asyncio
 import logging
 import re
-from typing import Any
+from typing import Any, Iterator
 
 from crewai.tools import tool
 
 from scrapers.x_scraper import XScraper
 from scrapers.linkedin_scraper import LinkedInPostScraper
 from scrapers.news_scraper import NewsScraper
-from processing.classifier import PostClassifier
+from processing.classifier import get_classifier
 from processing.extractor import InfoExtractor
 from processing.deduplicator import Deduplicator, make_fingerprint
 from storage.notion_client import NotionStorage
@@ -25,7 +25,8 @@ from research.contact_finder import ContactFinder
 from research.email_finder import EmailFinder
 from research.accurate_email_finder import AccurateEmailFinder
 from outreach.drafter import EmailDrafter
-from outreach.sender import EmailSender
+from outreach.async_sender import send_many
+from outreach.sender import get_email_sender
 
 import yaml
 
@@ -64,11 +65,13 @@ def get_dedup() -> Deduplicator:
 # Tool: Scrape all sources
 # ------------------------------------------------------------------
 
-@tool("scrape_all_sources")
-def scrape_all_sources(placeholder: str = "") -> list[dict]:
-    """Scrape X.com, LinkedIn, and news sites for AI/ML hiring/funding posts from the last 24 hours."""
-    all_posts: list[str | dict] = []
+def iter_scraped_posts() -> Iterator[dict]:
+    """
+    Yield posts source by source (X.com, then LinkedIn, then news).
 
+    Callers that only need the first N posts can stop iterating early and
+    the remaining scrapers are never started.
+    """
     xcfg = _settings["scraping"]["x"]
     licfg = _settings["scraping"]["linkedin"]
 
@@ -88,10 +91,11 @@ def scrape_all_sources(placeholder: str = "") -> list[dict]:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         x_posts = loop.run_until_complete(x.scrape())
-        all_posts.extend(x_posts)
         logger.info("X.com scraped: %d posts", len(x_posts))
     except Exception as exc:
         logger.error("X.com scraper failed: %s", exc)
+        x_posts = []
+    yield from x_posts
 
     # LinkedIn (funding + job flows) — always run alongside X for posts + web crawl
     logger.info("Starting LinkedIn scrape (funding + job, last 24h)...")
@@ -110,7 +114,6 @@ def scrape_all_sources(placeholder: str = "") -> list[dict]:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         li_posts = loop.run_until_complete(li.scrape())
-        all_posts.extend(li_posts)
         logger.info("LinkedIn scraped: %d posts", len(li_posts))
         if len(li_posts) == 0:
             logger.warning(
@@ -124,16 +127,24 @@ def scrape_all_sources(placeholder: str = "") -> list[dict]:
             exc,
             exc_info=True,
         )
+        li_posts = []
+    yield from li_posts
 
     # News
     try:
         news = NewsScraper()
         news_posts = news.scrape()
-        all_posts.extend(news_posts)
         logger.info("News scraped: %d posts", len(news_posts))
     except Exception as exc:
         logger.error("News scraper failed: %s", exc)
+        news_posts = []
+    yield from news_posts
+
 
+@tool("scrape_all_sources")
+def scrape_all_sources(placeholder: str = "") -> list[dict]:
+    """Scrape X.com, LinkedIn, and news sites for AI/ML hiring/funding posts from the last 24 hours."""
+    all_posts = list(iter_scraped_posts())
     logger.info("Total raw posts scraped: %d (X + LinkedIn + news)", len(all_posts))
     return all_posts
 
@@ -145,9 +156,9 @@ def scrape_all_sources(placeholder: str = "") -> list[dict]:
 @tool("process_and_store_leads")
 def process_and_store_leads(posts: list[dict]) -> list[dict]:
     """Classify posts (hiring/funding/both), extract info, dedup, and store in Notion Leads DB."""
-    classifier = PostClassifier()
-    extractor = InfoExtractor()
     dedup = get_dedup()
+    classifier = get_classifier()
+    extractor = InfoExtractor()
     notion = get_notion()
     prefs = _settings.get("processing", {}).get("candidate_preferences", {})
 
@@ -156,24 +167,27 @@ def process_and_store_leads(posts: list[dict]) -> list[dict]:
     skipped = {"dedup_fp": 0, "classify": 0, "company": 0, "years": 0,
                "senior": 0, "us_only": 0, "location": 0, "dedup_co": 0}
 
-    for post in posts:
+    # Classify the whole batch so LLM verification runs as batched requests.
+    # The classifier drops known fingerprints (layer 1 dedup) up front.
+    post_types = classifier.classify_many(posts, dedup=dedup)
+
+    # Extract every kept post up front: regex work in parallel, LLM lookups batched
+    extractor.extract_many([p for p, t in zip(posts, post_types) if t])
+
+    for post, post_type in zip(posts, post_types):
         text_preview = (post.get("text", "") or "")[:80]
 
-        # Layer 1 dedup: fingerprint
+        # Layer 1 dedup: also catches repeats stored earlier in this batch
         if dedup.is_duplicate_fingerprint(post):
             skipped["dedup_fp"] += 1
             continue
 
-        # Classify
-        post_type = classifier.classify(post)
         if not post_type:
             skipped["classify"] += 1
             logger.debug("Filtered (classify): %s", text_preview)
             continue
         post["post_type"] = post_type
 
-        # Extract info
-        post = extractor.extract(post)
         role = (post.get("role", "") or "").strip()
         required_years = post.get("required_years")
         is_senior_role = bool(post.get("is_senior_role"))
@@ -486,7 +500,7 @@ def draft_cold_emails(contacts: list[dict]) -> list[dict]:
 @tool("send_emails")
 def send_emails(drafts: list[dict]) -> str:
     """Send drafted cold emails via Gmail with rate limiting."""
-    sender = EmailSender()
+    sender = get_email_sender()
     notion = get_notion()
 
     sent = 0
@@ -496,18 +510,18 @@ def send_emails(drafts: list[dict]) -> str:
     drafts_sorted = sorted(drafts, key=lambda d: d.get("score", 0), reverse=True)
     max_to_send = min(20, sender.remaining_today())
 
-    for draft in drafts_sorted[:max_to_send]:
-        if not sender.can_send():
-            logger.warning("Daily send limit reached. Remaining drafts queued for tomorrow.")
-            break
+    batch = drafts_sorted[:max_to_send]
+    results = asyncio.run(
+        send_many(
+            sender,
+            [(d.get("to_email", ""), d.get("subject", ""), d.get("body", "")) for d in batch],
+        )
+    )
+    sender.close()
 
-        to_email = draft.get("to_email", "")
-        subject = draft.get("subject", "")
-        body = draft.get("body", "")
+    for draft, success in zip(batch, results):
         page_id = draft.get("page_id", "")
 
-        success = sender.send_with_delay(to_email, subject, body)
-
         if success:
             sent += 1
             if page_id:
@@ -806,7 +820,7 @@ async def run_company_outreach(
         logger.info("STEP 6: Sending %d emails", len(drafts))
         logger.info("=" * 60)
 
-        sender = EmailSender()
+        sender = get_email_sender()
         sent = 0
         failed = 0
 
@@ -844,6 +858,7 @@ async def run_company_outreach(
                     "  Failed to send to %s <%s>", draft["to_name"], draft["to_email"]
                 )
 
+        sender.close()
         summary["emails_sent"] = sent
         summary["emails_failed"] = failed
 
@@ -0,0 +1,25 @@
+"""
+Cached YAML config loading.
+
+Parsed files are memoised per (path, mtime), so repeated loads within a
+process are free and an edited file is picked up on the next call.
+Callers must treat the returned dict as read-only.
+"""
+
+import functools
+import os
+
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _load(path: str, mtime_ns: int) -> dict:
+    with open(path) as f:
+        return yaml.load(f, Loader=_Loader) or {}
+
+
+def load_yaml(path: str) -> dict:
+    """Return the parsed YAML at `path`, re-parsing only when it changes."""
+    return _load(path, os.stat(path).st_mtime_ns)
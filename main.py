@@ -12,12 +12,17 @@ Usage:
     python main.py --company "Mistral" --contacts 3
     python main.py --company-linkedin-url "https://www.linkedin.com/company/openai/" --contacts 5 --domain openai.com
     python main.py --linkedin-url "https://www.linkedin.com/in/USERNAME/" --domain "openai.com"
+    python main.py --contacts-only --keep-notion      Append to Notion instead of clearing it first
 """
 
 import argparse
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from collections import Counter
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -27,27 +32,48 @@ load_dotenv(Path(__file__).parent / ".env")
 
 from agents.crew import run_pipeline
 from agents.tools import run_company_outreach
-from agents.tools import scrape_all_sources, process_and_store_leads
+from agents.tools import iter_scraped_posts, process_and_store_leads
 from find_email_from_linkedin_profile import run_lookup
 from research.company_people_probe import (
     run_probe,
-    discover_company_linkedin_url,
+    discover_company_linkedin_urls,
     is_valid_company_name,
 )
 from scheduler import start_scheduler
 from storage.notion_client import NotionStorage
 
+# Log records go through a queue so the console/file writes happen on the
+# listener thread instead of blocking scraping loops on every logger call.
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(_log_formatter)
+_log_file = logging.FileHandler("pipeline.log", mode="a")
+_log_file.setFormatter(_log_formatter)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream, _log_file)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("pipeline.log", mode="a"),
-    ],
+    format="%(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 logger = logging.getLogger("main")
 
 
+def _clear_notion(keep: bool) -> None:
+    """Clear all Notion tables unless the caller asked to keep existing rows."""
+    if keep:
+        logger.info("--keep-notion set; leaving existing Notion rows in place.")
+        return
+    try:
+        notion = NotionStorage()
+        notion.clear_all_tables()
+    except Exception as exc:
+        logger.warning("Could not clear Notion tables (skipping): %s", exc)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="AI Cold Outreach Pipeline - Automated hiring/funding lead generation"
@@ -114,6 +140,11 @@ def main():
         action="store_true",
         help="Use visible browser (helps if LinkedIn checkpoint/verification appears)",
     )
+    parser.add_argument(
+        "--keep-notion",
+        action="store_true",
+        help="Do not clear Notion tables before --contacts-only / --company-linkedin-url runs",
+    )
 
     args = parser.parse_args()
 
@@ -128,15 +159,9 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    # Clear all Notion tables before this run
-    try:
-        notion = NotionStorage()
-        notion.clear_all_tables()
-    except Exception as exc:
-        logger.warning("Could not clear Notion tables (skipping): %s", exc)
-
     # ---- Company LinkedIn URL flow: People -> profiles -> emails -> Notion ----
     if args.company_linkedin_url:
+        _clear_notion(args.keep_notion)
         logger.info(
             "Starting company-page flow for: %s",
             args.company_linkedin_url,
@@ -173,19 +198,27 @@ def main():
 
     # ---- Scrape -> lead -> contact/email (store in Notion only) ----
     if args.contacts_only:
+        _clear_notion(args.keep_notion)
         logger.info("=== CONTACTS-ONLY: scrape X.com + LinkedIn (funding + job/hiring) -> leads -> recruiter contacts ===")
         try:
-            posts = scrape_all_sources.run()
-            n_x = sum(1 for p in posts if p.get("platform") == "x.com")
-            n_li = sum(1 for p in posts if p.get("platform") == "linkedin")
-            n_fund = sum(1 for p in posts if p.get("scrape_type") == "funding")
-            n_job = sum(1 for p in posts if p.get("scrape_type") in {"job", "hiring"})
+            # Stop scraping as soon as we have the top N posts.
+            posts = []
+            c_plat: Counter = Counter()
+            c_type: Counter = Counter()
+            for p in iter_scraped_posts():
+                posts.append(p)
+                c_plat[p.get("platform")] += 1
+                c_type[p.get("scrape_type")] += 1
+                if 0 < args.top_posts <= len(posts):
+                    break
             logger.info(
                 "Scraped %d raw posts (x.com=%d, linkedin=%d | funding=%d, job/hiring=%d)",
-                len(posts), n_x, n_li, n_fund, n_job,
+                len(posts),
+                c_plat["x.com"],
+                c_plat["linkedin"],
+                c_type["funding"],
+                c_type["job"] + c_type["hiring"],
             )
-            if args.top_posts > 0:
-                posts = posts[: args.top_posts]
             logger.info("Processing top %d posts", len(posts))
 
             leads = process_and_store_leads.run(posts)
@@ -204,16 +237,24 @@ def main():
                 seen.add(company)
                 companies.append(company)
 
-            logger.info("=== Finding recruiters/hiring managers at %d companies ===", len(companies))
-
-            total_contacts = 0
+            valid_companies = []
             for company in companies:
-                if not is_valid_company_name(company):
+                if is_valid_company_name(company):
+                    valid_companies.append(company)
+                else:
                     logger.info(
                         "Skipping '%s' — looks like a person name or too short.", company
                     )
-                    continue
-                company_url = discover_company_linkedin_url(company)
+            companies = valid_companies
+
+            logger.info("=== Finding recruiters/hiring managers at %d companies ===", len(companies))
+
+            # Resolve every company's LinkedIn URL up front in one parallel batch.
+            company_urls = discover_company_linkedin_urls(companies)
+
+            total_contacts = 0
+            for company in companies:
+                company_url = company_urls.get(company, "")
                 if not company_url:
                     logger.info(
                         "HTTP search found no URL for '%s'; will try browser fallback in run_probe.",
@@ -0,0 +1,106 @@
+"""
+Concurrent batch sending over a small pool of aiosmtplib sessions.
+
+Each worker owns one logged-in SMTP connection and drains a shared queue,
+sleeping its own random delay between messages, so N workers send roughly
+N times faster than EmailSender.send_with_delay while keeping per-connection
+pacing. Quota, headers and validation are shared with EmailSender.
+"""
+
+import asyncio
+import logging
+import random
+
+import aiosmtplib
+
+from outreach.sender import SMTP_HOST, SMTP_PORT, EmailSender
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECTIONS = 3
+
+
+async def _open(sender: EmailSender) -> aiosmtplib.SMTP:
+    smtp = aiosmtplib.SMTP(hostname=SMTP_HOST, port=SMTP_PORT, use_tls=True, timeout=15)
+    await smtp.connect()
+    await smtp.login(sender.your_email, sender.app_password)
+    return smtp
+
+
+async def _worker(
+    sender: EmailSender,
+    queue: asyncio.Queue,
+    results: list[bool],
+) -> None:
+    smtp: aiosmtplib.SMTP | None = None
+    try:
+        while True:
+            try:
+                idx, to_email, subject, body = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            if not sender.precheck(to_email):
+                continue
+
+            wire = sender.build_wire(to_email, subject, body)
+            try:
+                if smtp is None or not smtp.is_connected:
+                    smtp = await _open(sender)
+                await smtp.sendmail(sender.your_email, [to_email], wire)
+            except aiosmtplib.SMTPRecipientsRefused:
+                logger.warning("Recipient refused (bounce): %s", to_email)
+                continue
+            except aiosmtplib.SMTPAuthenticationError:
+                logger.error("Gmail auth failed. Check GMAIL_APP_PASSWORD.")
+                return
+            except Exception as exc:
+                logger.error("Failed to send to %s: %s", to_email, exc)
+                # Drop the broken session, closing its socket before the
+                # next message opens a fresh one.
+                if smtp is not None:
+                    try:
+                        smtp.close()
+                    except Exception:
+                        pass
+                smtp = None
+                continue
+
+            sender.record_sent(to_email)
+            results[idx] = True
+            if not queue.empty():
+                await asyncio.sleep(random.uniform(sender.delay_min, sender.delay_max))
+    finally:
+        if smtp is not None and smtp.is_connected:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                pass
+
+
+async def send_many(
+    sender: EmailSender,
+    messages: list[tuple[str, str, str]],
+    connections: int = DEFAULT_CONNECTIONS,
+) -> list[bool]:
+    """
+    Send (to_email, subject, body) tuples over up to `connections` sessions.
+
+    Returns one success flag per input message, in input order. Messages
+    beyond today's remaining quota are left unsent (False).
+    """
+    results = [False] * len(messages)
+    budget = min(len(messages), sender.remaining_today())
+    if budget <= 0:
+        if messages:
+            logger.warning("Daily email limit reached (%d). Skipping.", sender.max_per_day)
+        return results
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for idx, (to_email, subject, body) in enumerate(messages[:budget]):
+        queue.put_nowait((idx, to_email, subject, body))
+
+    workers = max(1, min(connections, budget))
+    logger.info("Sending %d emails over %d SMTP connections", budget, workers)
+    await asyncio.gather(*(_worker(sender, queue, results) for _ in range(workers)))
+    return results
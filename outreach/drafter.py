@@ -5,27 +5,49 @@ Generates personalized emails based on post type.
 
 import os
 import logging
+import random
 import time
 
-from groq import Groq
-
-import yaml
+import httpx
+from groq import APIConnectionError, Groq, InternalServerError, RateLimitError
 
+from config.loader import load_yaml
 from outreach.templates import SYSTEM_PROMPT, get_template
 
 logger = logging.getLogger(__name__)
 
+_MAX_ATTEMPTS = 3
+
+_groq_client: Groq | None = None
+
+
+def _get_groq(api_key: str) -> Groq:
+    """Process-wide Groq client so the keep-alive pool survives across drafters."""
+    global _groq_client
+    if _groq_client is None:
+        _groq_client = Groq(
+            api_key=api_key,
+            # EmailDrafter._complete owns retries; SDK retries would stack on top.
+            max_retries=0,
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+            ),
+        )
+    return _groq_client
+
+
+def _groq_model() -> str:
+    return load_yaml("config/settings.yaml")["outreach"]["groq_model"]
+
 
 class EmailDrafter:
     def __init__(self):
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY not set in environment")
-        self.client = Groq(api_key=api_key)
+        self.client = _get_groq(api_key)
 
-        with open("config/settings.yaml") as f:
-            cfg = yaml.safe_load(f)
-        self.model = cfg["outreach"]["groq_model"]
+        self.model = _groq_model()
 
         self.your_name = os.getenv("YOUR_NAME", "")
         self.your_role = os.getenv("YOUR_ROLE", "")
@@ -34,6 +56,7 @@ class EmailDrafter:
         self.linkedin_url = os.getenv("YOUR_LINKEDIN", "")
         self.github_url = os.getenv("YOUR_GITHUB", "")
         self.portfolio_url = os.getenv("YOUR_PORTFOLIO", "")
+        self._system_content: str | None = None
 
     def draft(self, lead: dict, contact: dict) -> dict:
         """
@@ -47,7 +70,7 @@ class EmailDrafter:
             {"subject": "...", "body": "..."}
         """
         post_type = lead.get("post_type", "hiring")
-        template = get_template(post_type)
+        static_prefix, template = get_template(post_type)
 
         prompt = template.format(
             contact_name=contact.get("name", "Hiring Manager"),
@@ -55,29 +78,15 @@ class EmailDrafter:
             company=lead.get("company_name", "your company"),
             role=lead.get("role", "an AI/ML role"),
             funding_details=lead.get("funding_amount", "secured new funding"),
-            your_name=self.your_name,
-            your_role=self.your_role,
-            your_skills=self.your_skills,
-            resume_link=self.resume_link,
-            linkedin_url=self.linkedin_url,
-            github_url=self.github_url,
-            portfolio_url=self.portfolio_url,
         )
 
-        try:
-            resp = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.8,
-                max_tokens=300,
-            )
-            raw = resp.choices[0].message.content.strip()
-        except Exception as exc:
-            logger.error("Groq API error: %s", exc)
-            time.sleep(5)
+        raw = self._complete(
+            [
+                {"role": "system", "content": self._system_prompt(static_prefix)},
+                {"role": "user", "content": prompt},
+            ]
+        )
+        if not raw:
             return {"subject": "", "body": ""}
 
         subject, body = self._parse_response(raw)
@@ -89,6 +98,58 @@ class EmailDrafter:
         )
         return {"subject": subject, "body": body}
 
+    def _system_prompt(self, static_prefix: str) -> str:
+        """SYSTEM_PROMPT + rendered sender profile, built once per drafter."""
+        if self._system_content is None:
+            profile = static_prefix.format(
+                your_name=self.your_name,
+                your_role=self.your_role,
+                your_skills=self.your_skills,
+                resume_link=self.resume_link,
+                linkedin_url=self.linkedin_url,
+                github_url=self.github_url,
+                portfolio_url=self.portfolio_url,
+            )
+            self._system_content = f"{SYSTEM_PROMPT}\n\n{profile}"
+        return self._system_content
+
+    def _complete(self, messages: list[dict]) -> str:
+        """
+        Run the chat completion, retrying rate limits and transient errors.
+
+        429s honour the server's Retry-After header; connection errors and
+        5xx responses back off exponentially. Both add up to 1s of jitter.
+        Returns "" once retries are exhausted or on a non-retryable error.
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                resp = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=0.8,
+                    max_tokens=300,
+                )
+                return resp.choices[0].message.content.strip()
+            except RateLimitError as exc:
+                retry_after = exc.response.headers.get("retry-after")
+                try:
+                    wait = float(retry_after) if retry_after else 2 ** attempt
+                except ValueError:
+                    wait = 2 ** attempt
+                logger.warning("Groq rate limited (attempt %d/%d)", attempt + 1, _MAX_ATTEMPTS)
+            except (APIConnectionError, InternalServerError) as exc:
+                wait = 2 ** attempt
+                logger.warning(
+                    "Groq transient error (attempt %d/%d): %s", attempt + 1, _MAX_ATTEMPTS, exc,
+                )
+            except Exception as exc:
+                logger.error("Groq API error: %s", exc)
+                return ""
+            if attempt + 1 < _MAX_ATTEMPTS:
+                time.sleep(wait + random.random())
+        logger.error("Groq API error: giving up after %d attempts", _MAX_ATTEMPTS)
+        return ""
+
     @staticmethod
     def _parse_response(raw: str) -> tuple[str, str]:
         """Split LLM response into subject and body."""
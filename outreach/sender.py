@@ -3,23 +3,65 @@ Gmail SMTP sender with rate limiting, bounce tracking, and proper headers.
 Uses App Password (free, no API needed).
 """
 
+import atexit
+import html
 import os
 import json
 import logging
+import quopri
 import random
 import smtplib
+import threading
 import time
 from datetime import date
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.header import Header
 from pathlib import Path
 
-import yaml
+from config.loader import load_yaml
 
 logger = logging.getLogger(__name__)
 
 QUOTA_FILE = Path("./browser_data/quotas/email_sender.json")
 
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+# Gmail starts refusing after roughly 100 messages on one connection.
+_MAX_PER_CONNECTION = 100
+# The quota file is advisory; flush it every few sends instead of every send.
+_QUOTA_FLUSH_EVERY = 5
+
+# Both parts are quoted-printable, where a literal "=_" can never occur, so a
+# fixed boundary containing "=_" cannot collide with body content.
+_BOUNDARY = "=_outpilot_alt_=_"
+_PART_TEXT = (
+    f"--{_BOUNDARY}\r\n"
+    "Content-Type: text/plain; charset=\"utf-8\"\r\n"
+    "Content-Transfer-Encoding: quoted-printable\r\n\r\n"
+).encode()
+_PART_HTML = (
+    f"\r\n--{_BOUNDARY}\r\n"
+    "Content-Type: text/html; charset=\"utf-8\"\r\n"
+    "Content-Transfer-Encoding: quoted-printable\r\n\r\n"
+).encode()
+_CLOSE = f"\r\n--{_BOUNDARY}--\r\n".encode()
+_HTML_OPEN = "<html><body><p>"
+_HTML_CLOSE = "</p></body></html>"
+
+
+def _qp(text: str) -> bytes:
+    """UTF-8 quoted-printable body with CRLF line endings."""
+    return quopri.encodestring(text.encode("utf-8")).replace(b"\n", b"\r\n")
+
+
+def _header_value(value: str) -> str:
+    """Single-line header value; RFC 2047-encoded when not plain ASCII."""
+    value = " ".join(value.split())
+    if value.isascii():
+        return value
+    # Folded encoded words must continue with CRLF: the wire bytes go to
+    # sendmail as-is and no line-ending normalisation happens downstream.
+    return Header(value, "utf-8").encode(linesep="\r\n")
+
 
 class EmailSender:
     def __init__(self):
@@ -29,49 +71,149 @@ class EmailSender:
         if not self.gmail_email or not self.app_password:
             raise ValueError("GMAIL_EMAIL and GMAIL_APP_PASSWORD must be set in .env")
 
-        with open("config/settings.yaml") as f:
-            cfg = yaml.safe_load(f)["outreach"]
+        cfg = load_yaml("config/settings.yaml")["outreach"]
         self.max_per_day = cfg["max_emails_per_day"]
         self.delay_min = cfg["send_delay_min"]
         self.delay_max = cfg["send_delay_max"]
 
         self.your_name = os.getenv("YOUR_NAME", "")
         self.your_email = self.gmail_email
+        # Identical for every message from this sender.
+        self._hdr_template = (
+            f"From: {_header_value(self.your_name)} <{self.your_email}>\r\n"
+            f"Reply-To: {self.your_email}\r\n"
+            "MIME-Version: 1.0\r\n"
+            f"Content-Type: multipart/alternative; boundary=\"{_BOUNDARY}\"\r\n"
+        ).encode()
 
+        QUOTA_FILE.parent.mkdir(parents=True, exist_ok=True)
+        self._quota_date = date.today()
         self._sent_today = self._load_quota()
+        self._unsaved_sends = 0
+        atexit.register(self._save_quota)
+
+        self._smtp: smtplib.SMTP_SSL | None = None
+        self._sent_on_conn = 0
+
+    def __enter__(self) -> "EmailSender":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Quota
     # ------------------------------------------------------------------
 
     def _load_quota(self) -> int:
-        QUOTA_FILE.parent.mkdir(parents=True, exist_ok=True)
         if QUOTA_FILE.exists():
             data = json.loads(QUOTA_FILE.read_text())
-            if data.get("date") == date.today().isoformat():
+            if data.get("date") == self._quota_date.isoformat():
                 return data.get("count", 0)
         return 0
 
+    def _roll_quota_date(self) -> None:
+        """Start a fresh count when the date changes (long-lived scheduler process)."""
+        today = date.today()
+        if today == self._quota_date:
+            return
+        self._save_quota()  # pending sends still belong to the previous day
+        self._quota_date = today
+        self._sent_today = self._load_quota()
+        self._unsaved_sends = 0
+
     def _save_quota(self) -> None:
-        QUOTA_FILE.parent.mkdir(parents=True, exist_ok=True)
-        QUOTA_FILE.write_text(
-            json.dumps({"date": date.today().isoformat(), "count": self._sent_today})
+        """Write pending sends to the quota file (atomic replace)."""
+        if not self._unsaved_sends:
+            return
+        tmp = QUOTA_FILE.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"date": self._quota_date.isoformat(), "count": self._sent_today})
         )
+        os.replace(tmp, QUOTA_FILE)
+        self._unsaved_sends = 0
 
     def can_send(self) -> bool:
+        self._roll_quota_date()
         return self._sent_today < self.max_per_day
 
     def remaining_today(self) -> int:
+        self._roll_quota_date()
         return max(0, self.max_per_day - self._sent_today)
 
+    # ------------------------------------------------------------------
+    # Connection
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> smtplib.SMTP_SSL:
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=15)
+        server.login(self.your_email, self.app_password)
+        self._smtp = server
+        self._sent_on_conn = 0
+        return server
+
+    def _get_server(self) -> smtplib.SMTP_SSL:
+        """Return the cached logged-in session, reconnecting if stale or full."""
+        if self._smtp is not None and self._sent_on_conn >= _MAX_PER_CONNECTION:
+            self.close()
+        if self._smtp is None:
+            return self._connect()
+        try:
+            self._smtp.noop()
+            return self._smtp
+        except smtplib.SMTPException:
+            logger.info("SMTP session dropped; reconnecting.")
+            self._drop_session()
+            return self._connect()
+
+    def _drop_session(self) -> None:
+        """Forget a dead session, closing its socket first."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.close()
+        except OSError:
+            pass
+        self._smtp = None
+
+    def close(self) -> None:
+        """Flush the quota file and close the cached SMTP session, if any."""
+        self._save_quota()
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._smtp = None
+
     # ------------------------------------------------------------------
     # Send
     # ------------------------------------------------------------------
 
-    def send(self, to_email: str, subject: str, body: str) -> bool:
+    def build_wire(self, to_email: str, subject: str, body: str) -> bytes:
         """
-        Send a single email. Returns True on success, False on failure.
+        Serialized plain + HTML alternative message for one recipient.
+
+        Only To, Subject and the two bodies are built per send; the rest is
+        the prebuilt header template and constant MIME part headers.
         """
+        html_body = html.escape(body).replace("\n", "<br>")
+        return b"".join(
+            (
+                self._hdr_template,
+                f"To: {_header_value(to_email)}\r\n"
+                f"Subject: {_header_value(subject)}\r\n\r\n".encode(),
+                _PART_TEXT,
+                _qp(body),
+                _PART_HTML,
+                _qp(f"{_HTML_OPEN}{html_body}{_HTML_CLOSE}"),
+                _CLOSE,
+            )
+        )
+
+    def precheck(self, to_email: str) -> bool:
+        """Quota and address checks shared by the sync and async send paths."""
         if not self.can_send():
             logger.warning("Daily email limit reached (%d). Skipping.", self.max_per_day)
             return False
@@ -79,34 +221,41 @@ class EmailSender:
         if not to_email or "@" not in to_email:
             logger.warning("Invalid email: %s", to_email)
             return False
+        return True
 
-        msg = MIMEMultipart("alternative")
-        msg["From"] = f"{self.your_name} <{self.your_email}>"
-        msg["To"] = to_email
-        msg["Subject"] = subject
-        msg["Reply-To"] = self.your_email
-
-        html_body = body.replace("\n", "<br>")
-        html_part = MIMEText(
-            f"<html><body><p>{html_body}</p></body></html>", "html"
+    def record_sent(self, to_email: str) -> None:
+        """Count a successful send against today's quota."""
+        self._roll_quota_date()
+        self._sent_today += 1
+        self._unsaved_sends += 1
+        if self._unsaved_sends >= _QUOTA_FLUSH_EVERY or not self.can_send():
+            self._save_quota()
+        logger.info(
+            "Sent email to %s (%d/%d today)",
+            to_email,
+            self._sent_today,
+            self.max_per_day,
         )
-        text_part = MIMEText(body, "plain")
-        msg.attach(text_part)
-        msg.attach(html_part)
+
+    def send(self, to_email: str, subject: str, body: str) -> bool:
+        """
+        Send a single email. Returns True on success, False on failure.
+        """
+        if not self.precheck(to_email):
+            return False
+
+        wire = self.build_wire(to_email, subject, body)
 
         try:
-            with smtplib.SMTP_SSL("smtp.gmail.com", 465, timeout=15) as server:
-                server.login(self.your_email, self.app_password)
-                server.sendmail(self.your_email, to_email, msg.as_string())
+            try:
+                self._get_server().sendmail(self.your_email, to_email, wire)
+            except smtplib.SMTPServerDisconnected:
+                # Server closed the idle session between noop() and send.
+                self._drop_session()
+                self._get_server().sendmail(self.your_email, to_email, wire)
+            self._sent_on_conn += 1
 
-            self._sent_today += 1
-            self._save_quota()
-            logger.info(
-                "Sent email to %s (%d/%d today)",
-                to_email,
-                self._sent_today,
-                self.max_per_day,
-            )
+            self.record_sent(to_email)
             return True
 
         except smtplib.SMTPRecipientsRefused:
@@ -127,3 +276,20 @@ class EmailSender:
             logger.info("Waiting %.0f seconds before next send...", delay)
             time.sleep(delay)
         return result
+
+
+_default: EmailSender | None = None
+_default_lock = threading.Lock()
+
+
+def get_email_sender() -> EmailSender:
+    """
+    Process-wide EmailSender, so every send path shares one quota counter
+    and SMTP session. close() after a batch; the session reopens lazily.
+    """
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = EmailSender()
+    return _default
@@ -1,5 +1,9 @@
 """
 Prompt templates for cold email drafting, one per post type.
+
+The sender's identity and links live in SENDER_PROFILE, which is rendered
+once and appended to the system prompt, so every request in a run shares
+the same prefix. Only the short contact/company tail varies per draft.
 """
 
 SYSTEM_PROMPT = (
@@ -9,9 +13,17 @@ SYSTEM_PROMPT = (
     "Sound like a real person, not a template."
 )
 
+SENDER_PROFILE = """The sender is {your_name}, an {your_role} with skills in {your_skills}.
+
+Sender links:
+- Resume: {resume_link}
+- LinkedIn: {linkedin_url}
+- GitHub: {github_url}
+- Portfolio: {portfolio_url}"""
+
 FUNDING_TEMPLATE = """Write a cold email to {contact_name} ({contact_title}) at {company}.
 
-Context: {company} just {funding_details}. The sender is {your_name}, an {your_role} with skills in {your_skills}.
+Context: {company} just {funding_details}.
 
 Requirements:
 - Open with the funding news as the hook (show you're paying attention)
@@ -20,16 +32,11 @@ Requirements:
 - End with a soft ask (chat, not "give me a job")
 - Under 100 words, 4-5 sentences
 - Subject line included on the first line as "Subject: ..."
-
-Sender links:
-- Resume: {resume_link}
-- LinkedIn: {linkedin_url}
-- GitHub: {github_url}
-- Portfolio: {portfolio_url}"""
+"""
 
 HIRING_TEMPLATE = """Write a cold email to {contact_name} ({contact_title}) at {company}.
 
-Context: {company} posted about hiring for {role}. The sender is {your_name}, an {your_role} with skills in {your_skills}.
+Context: {company} posted about hiring for {role}.
 
 Requirements:
 - Reference the specific role they posted about
@@ -38,16 +45,11 @@ Requirements:
 - End by asking for a brief conversation
 - Under 100 words, 4-5 sentences
 - Subject line included on the first line as "Subject: ..."
-
-Sender links:
-- Resume: {resume_link}
-- LinkedIn: {linkedin_url}
-- GitHub: {github_url}
-- Portfolio: {portfolio_url}"""
+"""
 
 BOTH_TEMPLATE = """Write a cold email to {contact_name} ({contact_title}) at {company}.
 
-Context: {company} just {funding_details} AND is hiring for {role}. The sender is {your_name}, an {your_role} with skills in {your_skills}.
+Context: {company} just {funding_details} AND is hiring for {role}.
 
 Requirements:
 - Congratulate on the funding (brief, not sycophantic)
@@ -56,19 +58,19 @@ Requirements:
 - End with a call to action
 - Under 100 words, 4-5 sentences
 - Subject line included on the first line as "Subject: ..."
+"""
 
-Sender links:
-- Resume: {resume_link}
-- LinkedIn: {linkedin_url}
-- GitHub: {github_url}
-- Portfolio: {portfolio_url}"""
 
+def get_template(post_type: str) -> tuple[str, str]:
+    """
+    Return (static_prefix, variable_tail) for the post type.
 
-def get_template(post_type: str) -> str:
-    """Return the appropriate template for the post type."""
+    static_prefix is the sender profile (goes in the system message);
+    variable_tail is the per-contact user prompt.
+    """
     mapping = {
         "funding": FUNDING_TEMPLATE,
         "hiring": HIRING_TEMPLATE,
         "both": BOTH_TEMPLATE,
     }
-    return mapping.get(post_type, HIRING_TEMPLATE)
+    return SENDER_PROFILE, mapping.get(post_type, HIRING_TEMPLATE)
@@ -5,24 +5,63 @@ Uses Groq LLM (llama-3.3-70b-versatile) to drop news/commentary posts
 that only discuss hiring in general rather than an actual job or funding.
 """
 
+import atexit
+import hashlib
+import json
 import logging
 import os
 import re
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
+from config.loader import load_yaml
+
+if TYPE_CHECKING:
+    from processing.deduplicator import Deduplicator
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 _groq_client = None
 _groq_model = None
 
+# LLM verdicts persist across runs so re-scraped posts skip the Groq call.
+LLM_DECISIONS_FILE = Path("./browser_data/quotas/llm_decisions.json")
+_llm_decisions: dict[str, bool] | None = None
+_llm_decisions_dirty = False
+
+_AI_FUNDING_TERMS = ("artificial intelligence", "machine learning", "llm", "ai", "ml")
+
+# A hiring/funding score at or above this marks the post as that type.
+_SCORE_THRESHOLD = 4
+# Only the head of a post is classified; the signal is almost always up front
+# and long newsletters/threads would otherwise dominate normalization cost.
+_CLASSIFY_WINDOW = 2048
+
+_RE_WE_HIRING = re.compile(r"\bwe('re| are)? hiring\b")
+_RE_HIRING_AI = re.compile(r"\b(hiring|looking for|open role)\b.*\b(ai|ml|llm|nlp|vision)\b")
+_RE_MONEY = re.compile(r"\$\s?\d+([.,]\d+)?\s?(m|b|million|billion)\b")
+
 
 def _get_groq():
+    """Process-wide Groq client on one keep-alive HTTP pool for all relevance checks."""
     global _groq_client
     if _groq_client is None and os.getenv("GROQ_API_KEY"):
         try:
+            import httpx
             from groq import Groq
-            _groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+            http = httpx.Client(
+                timeout=20.0,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+            )
+            atexit.register(http.close)
+            _groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"), http_client=http)
         except Exception as e:
             logger.debug("Groq client init failed: %s", e)
     return _groq_client
@@ -32,40 +71,46 @@ def _get_groq_model() -> str:
     global _groq_model
     if _groq_model is None:
         try:
-            with open("config/settings.yaml") as f:
-                cfg = yaml.safe_load(f)
+            cfg = load_yaml("config/settings.yaml")
             _groq_model = (cfg.get("outreach") or {}).get("groq_model", "llama-3.3-70b-versatile")
         except Exception:
             _groq_model = "llama-3.3-70b-versatile"
     return _groq_model
 
 
-def _is_actual_job_or_funding_llm(text: str) -> bool:
+_RELEVANCE_RULES = (
+    "You are a strict filter for job and funding posts. "
+    "Your ONLY task is to decide if the given post is:\n"
+    "- JOB_OR_FUNDING: A real announcement (a specific company hiring for a role, or a specific company that raised funding). "
+    "The post should invite applications, link to a job, or announce a concrete funding round for a named company.\n"
+    "- NEWS_OR_COMMENTARY: General news, opinion, or commentary about hiring/funding/AI in the industry. "
+    "Examples: 'IBM plans to hire...' as news, 'LLMs are not AGI', 'companies are still hiring engineers', "
+    "'AI has not replaced anyone', opinion pieces, hot takes, or posts that only discuss hiring in general.\n"
+)
+
+# Posts per batched relevance request; keeps the prompt well under 2k tokens.
+_LLM_BATCH_SIZE = 10
+_RE_BATCH_LINE = re.compile(r"^\s*(\d+)\s*[.):\-]\s*(JOB_OR_FUNDING|NEWS_OR_COMMENTARY|NEWS)", re.M)
+
+
+def _query_llm_relevance(text: str) -> bool | None:
     """
     Use Groq LLM to decide if the post is an actual job/funding announcement
     (from or about a specific company) vs general news/commentary/opinion.
-    Returns True only for JOB_OR_FUNDING.
+    Returns True for JOB_OR_FUNDING, False for NEWS_OR_COMMENTARY, and None
+    when no verdict could be obtained (no API key or request failed).
     """
     client = _get_groq()
     if not client:
-        return True  # no API: keep post (rule-based only)
+        return None
     model = _get_groq_model()
-    system = (
-        "You are a strict filter for job and funding posts. "
-        "Your ONLY task is to decide if the given post is:\n"
-        "- JOB_OR_FUNDING: A real announcement (a specific company hiring for a role, or a specific company that raised funding). "
-        "The post should invite applications, link to a job, or announce a concrete funding round for a named company.\n"
-        "- NEWS_OR_COMMENTARY: General news, opinion, or commentary about hiring/funding/AI in the industry. "
-        "Examples: 'IBM plans to hire...' as news, 'LLMs are not AGI', 'companies are still hiring engineers', "
-        "'AI has not replaced anyone', opinion pieces, hot takes, or posts that only discuss hiring in general.\n"
-        "Reply with EXACTLY one of: JOB_OR_FUNDING or NEWS_OR_COMMENTARY. No other text."
-    )
+    system = _RELEVANCE_RULES + "Reply with EXACTLY one of: JOB_OR_FUNDING or NEWS_OR_COMMENTARY. No other text."
     try:
         resp = client.chat.completions.create(
             model=model,
             messages=[
                 {"role": "system", "content": system},
-                {"role": "user", "content": (text or "")[:600]},
+                {"role": "user", "content": text},
             ],
             temperature=0.0,
             max_tokens=20,
@@ -76,26 +121,193 @@ def _is_actual_job_or_funding_llm(text: str) -> bool:
         return True
     except Exception as exc:
         logger.debug("LLM relevance check failed: %s", exc)
-        return True  # on error, keep post
+        return None
+
+
+def _query_llm_relevance_batch(texts: list[str]) -> list[bool | None]:
+    """
+    Classify several posts in one Groq request. Posts the model skipped or
+    labelled unparseably come back as None, like a failed single query.
+    """
+    if len(texts) == 1:
+        return [_query_llm_relevance(texts[0])]
+    client = _get_groq()
+    if not client:
+        return [None] * len(texts)
+    system = _RELEVANCE_RULES + (
+        "You will get several numbered posts. Reply with one line per post in the form "
+        "'<number>. JOB_OR_FUNDING' or '<number>. NEWS_OR_COMMENTARY'. No other text."
+    )
+    user = "\n".join(f"{i}. {t}" for i, t in enumerate(texts, start=1))
+    try:
+        resp = client.chat.completions.create(
+            model=_get_groq_model(),
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            temperature=0.0,
+            max_tokens=20 * len(texts),
+        )
+        raw = (resp.choices[0].message.content or "").upper()
+    except Exception as exc:
+        logger.debug("Batched LLM relevance check failed: %s", exc)
+        return [None] * len(texts)
+
+    verdicts: list[bool | None] = [None] * len(texts)
+    for num, label in _RE_BATCH_LINE.findall(raw):
+        idx = int(num) - 1
+        if 0 <= idx < len(texts):
+            verdicts[idx] = not label.startswith("NEWS")
+    return verdicts
+
+
+def _load_llm_decisions() -> dict[str, bool]:
+    global _llm_decisions
+    if _llm_decisions is None:
+        _llm_decisions = {}
+        try:
+            if LLM_DECISIONS_FILE.exists():
+                _llm_decisions = json.loads(LLM_DECISIONS_FILE.read_text())
+        except Exception as exc:
+            logger.debug("Could not read LLM decision cache: %s", exc)
+        atexit.register(_save_llm_decisions)
+    return _llm_decisions
+
+
+def _save_llm_decisions() -> None:
+    if not _llm_decisions_dirty or _llm_decisions is None:
+        return
+    try:
+        LLM_DECISIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        LLM_DECISIONS_FILE.write_text(json.dumps(_llm_decisions))
+    except Exception as exc:
+        logger.debug("Could not write LLM decision cache: %s", exc)
+
+
+def _is_actual_job_or_funding_llm(text: str) -> bool:
+    """
+    Cached LLM relevance check. Verdicts are keyed by a hash of the first
+    600 chars; when no verdict is available the post is kept.
+    """
+    global _llm_decisions_dirty
+    snippet = (text or "")[:600]
+    key = hashlib.blake2b(snippet.encode(), digest_size=8).hexdigest()
+    decisions = _load_llm_decisions()
+    if key in decisions:
+        return decisions[key]
+
+    verdict = _query_llm_relevance(snippet)
+    if verdict is None:
+        return True  # no API or error: keep post (rule-based only)
+    decisions[key] = verdict
+    _llm_decisions_dirty = True
+    return verdict
+
+
+def _is_actual_job_or_funding_llm_batch(texts: list[str]) -> list[bool]:
+    """Cached relevance check for many posts, sending uncached ones in batches."""
+    global _llm_decisions_dirty
+    snippets = [(t or "")[:600] for t in texts]
+    keys = [hashlib.blake2b(s.encode(), digest_size=8).hexdigest() for s in snippets]
+    decisions = _load_llm_decisions()
+
+    pending = [i for i, k in enumerate(keys) if k not in decisions]
+    for start in range(0, len(pending), _LLM_BATCH_SIZE):
+        chunk = pending[start:start + _LLM_BATCH_SIZE]
+        verdicts = _query_llm_relevance_batch([snippets[i] for i in chunk])
+        for i, verdict in zip(chunk, verdicts):
+            if verdict is not None:
+                decisions[keys[i]] = verdict
+                _llm_decisions_dirty = True
+
+    # No verdict (no API or error): keep post, as in the single check.
+    return [decisions.get(k, True) for k in keys]
+
+
+def _kw_table(items) -> tuple[str, ...]:
+    """Lowercased, interned keywords as a tuple, longest first."""
+    return tuple(
+        sorted((sys.intern(str(k).lower()) for k in items), key=len, reverse=True)
+    )
+
+
+def _compile_any(keywords: list[bytes]):
+    """
+    Build `lambda t: kw1 in t or kw2 in t or ...` for a fixed keyword list.
+
+    Each test compiles to a single CONTAINS_OP, avoiding the generator frame
+    that any(kw in t for kw in ...) creates on every call.
+    """
+    if not keywords:
+        return lambda t: False
+    src = "lambda t: " + " or ".join(f"{kw!r} in t" for kw in keywords)
+    return eval(compile(src, "<keyword-matcher>", "eval"), {})
+
+
+class _KeywordMatcher:
+    """
+    Substring matcher over several keyword categories at once.
+
+    With pyahocorasick installed, one linear pass over the text reports every
+    category that has at least one hit; otherwise falls back to generated
+    `in` checks over the UTF-8 bytes, which skip str's wide-character
+    comparisons.
+    """
+
+    def __init__(self, categories: dict[str, tuple[str, ...]]):
+        categories = {cat: [kw for kw in kws if kw] for cat, kws in categories.items()}
+        self._checks = {
+            cat: _compile_any([kw.encode("utf-8") for kw in kws])
+            for cat, kws in categories.items()
+        }
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for cat, kws in categories.items():
+                for kw in kws:
+                    cats = automaton.get(kw, ())
+                    automaton.add_word(kw, cats + (cat,))
+            if len(automaton):
+                automaton.make_automaton()
+                self._automaton = automaton
+
+    def categories(self, text: str, gate: str | None = None) -> set[str]:
+        """
+        Return the set of categories with at least one keyword in text.
+
+        If `gate` is given and has no hit, the fallback path returns an empty
+        set without scanning the other categories (the caller rejects anyway).
+        """
+        if self._automaton is not None:
+            hits: set[str] = set()
+            for _, cats in self._automaton.iter(text):
+                hits.update(cats)
+            return hits
+        text_b = text.encode("utf-8", "ignore")
+        if gate is not None and not self._checks[gate](text_b):
+            return set()
+        return {cat for cat, check in self._checks.items() if check(text_b)}
 
 
 class PostClassifier:
-    def __init__(self):
-        with open("config/keywords.yaml") as f:
-            kw = yaml.safe_load(f)
-        self.hiring_kw = [k.lower() for k in kw["hiring_keywords"]]
-        self.funding_kw = [k.lower() for k in kw["funding_keywords"]]
-        self.tech_kw = [k.lower() for k in kw["tech_keywords"]]
-        self.exclude = [k.lower() for k in kw["exclude_patterns"]]
-
-        with open("config/blocklist.yaml") as f:
-            bl = yaml.safe_load(f)
-        self.blocked_usernames = [u.lower() for u in bl.get("blocked_usernames", [])]
-        self.blocked_companies = [c.lower() for c in bl.get("blocked_companies", [])]
-        self.blocked_domains = [d.lower() for d in bl.get("blocked_domains", [])]
+    def __init__(self, dedup: "Deduplicator | None" = None):
+        # When set, already-seen posts are dropped before any keyword/LLM work.
+        self.dedup = dedup
+
+        kw = load_yaml("config/keywords.yaml")
+        self.hiring_kw = _kw_table(kw["hiring_keywords"])
+        self.funding_kw = _kw_table(kw["funding_keywords"])
+        self.tech_kw = _kw_table(kw["tech_keywords"])
+        self.exclude = _kw_table(kw["exclude_patterns"])
+
+        bl = load_yaml("config/blocklist.yaml")
+        self.blocked_usernames = _kw_table(bl.get("blocked_usernames", []))
+        self.blocked_companies = _kw_table(bl.get("blocked_companies", []))
+        self.blocked_domains = _kw_table(bl.get("blocked_domains", []))
 
         # Strong relevance signals for actual AI/ML hiring posts
-        self.ai_role_markers = [
+        self.ai_role_markers = _kw_table([
             "ai engineer",
             "ml engineer",
             "machine learning engineer",
@@ -111,8 +323,8 @@ class PostClassifier:
             "ml researcher",
             "applied ml",
             "deep learning engineer",
-        ]
-        self.position_nouns = [
+        ])
+        self.position_nouns = _kw_table([
             "engineer",
             "scientist",
             "researcher",
@@ -120,8 +332,8 @@ class PostClassifier:
             "role",
             "position",
             "opening",
-        ]
-        self.funding_strong_markers = [
+        ])
+        self.funding_strong_markers = _kw_table([
             "series a",
             "series b",
             "series c",
@@ -133,8 +345,8 @@ class PostClassifier:
             "secured funding",
             "backed by",
             "valuation",
-        ]
-        self.noise_markers = [
+        ])
+        self.noise_markers = _kw_table([
             "killed",
             "murdered",
             "war",
@@ -146,7 +358,7 @@ class PostClassifier:
             "celebrity",
             "crypto giveaway",
             "airdrop",
-        ]
+        ])
         # Patterns that indicate commentary ABOUT hiring, not actual hiring
         self.opinion_patterns = [
             r"^stop\s+hiring",
@@ -161,6 +373,23 @@ class PostClassifier:
             r"\bfree\b.{0,30}\bkit\b",
             r"\bgiving away\b.{0,50}\b(founders|startups|companies)\b",
         ]
+        self._opinion_re = re.compile(
+            "|".join(f"(?:{pat})" for pat in self.opinion_patterns)
+        )
+        self._matcher = _KeywordMatcher(
+            {
+                "exclude": self.exclude,
+                "blocked_company": self.blocked_companies,
+                "noise": self.noise_markers,
+                "tech": self.tech_kw,
+                "hiring": self.hiring_kw,
+                "position": self.position_nouns,
+                "ai_role": self.ai_role_markers,
+                "funding": self.funding_kw,
+                "funding_strong": self.funding_strong_markers,
+                "ai_funding": _AI_FUNDING_TERMS,
+            }
+        )
 
     def classify(self, post: dict) -> str | None:
         """
@@ -168,100 +397,180 @@ class PostClassifier:
 
         Returns None if the post should be dropped.
         """
-        text = self._normalize(post.get("text", ""))
+        label, text, confident = self._rule_classify(post, self.dedup)
+        if label is None:
+            return None
+        # LLM relevance: drop news/commentary (e.g. "IBM plans to hire..." as general news)
+        if not confident and not _is_actual_job_or_funding_llm(text):
+            return None
+        return label
+
+    def classify_many(
+        self, posts: list[dict], dedup: "Deduplicator | None" = None
+    ) -> list[str | None]:
+        """
+        classify() for a batch: rule-based pass first, then one batched LLM
+        verification pass over the posts that still need it.
+
+        `dedup` overrides the instance's deduplicator for this batch, so a
+        shared classifier can be used with a caller-owned dedup cache.
+        """
+        dedup = dedup or self.dedup
+        labels: list[str | None] = []
+        to_verify: list[int] = []
+        texts: list[str] = []
+        for post in posts:
+            label, text, confident = self._rule_classify(post, dedup)
+            labels.append(label)
+            if label is not None and not confident:
+                to_verify.append(len(labels) - 1)
+                texts.append(text)
+
+        if texts:
+            for idx, keep in zip(to_verify, _is_actual_job_or_funding_llm_batch(texts)):
+                if not keep:
+                    labels[idx] = None
+        return labels
+
+    def _rule_classify(
+        self, post: dict, dedup: "Deduplicator | None" = None
+    ) -> tuple[str | None, str, bool]:
+        """
+        Rule-based half of classify(): (label, normalized text, high_confidence).
+        A label with high_confidence=False still needs the LLM check.
+        """
+        raw = post.get("text", "") or ""
+        # Normalizing never lengthens the text, so short posts can skip it.
+        if len(raw) < 30:
+            return None, "", False
+        text = self._normalize(raw)
         source_url = (post.get("source_url", "") or "").lower()
         author = (
             post.get("author_username", "") or post.get("author", "")
         ).lower()
 
+        # Cheapest rejections first: length, then the short author/URL strings.
         if len(text) < 30:
-            return None
-
-        for pattern in self.exclude:
-            if pattern in text:
-                return None
-
+            return None, text, False
+        if dedup is not None and dedup.is_duplicate_fingerprint(post):
+            return None, text, False
         if any(blocked in author for blocked in self.blocked_usernames):
-            return None
-        if any(company in text for company in self.blocked_companies):
-            return None
+            return None, text, False
         if any(domain in source_url for domain in self.blocked_domains):
-            return None
-        if any(noise in text for noise in self.noise_markers):
-            return None
-        if any(re.search(pat, text) for pat in self.opinion_patterns):
-            return None
-
-        has_tech = any(kw in text for kw in self.tech_kw)
-        if not has_tech:
-            return None
+            return None, text, False
+
+        hits = self._matcher.categories(text, gate="tech")
+        if "exclude" in hits:
+            return None, text, False
+        # Most posts fail the tech gate, so check it before the remaining filters.
+        if "tech" not in hits:
+            return None, text, False
+        if "blocked_company" in hits or "noise" in hits:
+            return None, text, False
+        if self._opinion_re.search(text):
+            return None, text, False
 
         # Weighted relevance checks
-        hiring_score = self._hiring_score(text)
-        funding_score = self._funding_score(text)
+        hiring_score = self._hiring_score(text, hits)
+        funding_score = self._funding_score(text, hits)
 
-        has_hiring = hiring_score >= 4
-        has_funding = funding_score >= 4
+        has_hiring = hiring_score >= _SCORE_THRESHOLD
+        has_funding = funding_score >= _SCORE_THRESHOLD
+        if not has_hiring and not has_funding:
+            return None, text, False
 
-        # LLM relevance: drop news/commentary (e.g. "IBM plans to hire..." as general news)
         if has_hiring and has_funding:
-            if not _is_actual_job_or_funding_llm(text):
-                return None
-            return "both"
-        if has_hiring:
-            if not _is_actual_job_or_funding_llm(text):
-                return None
-            return "hiring"
-        if has_funding:
-            if not _is_actual_job_or_funding_llm(text):
-                return None
-            return "funding"
-        return None
+            label = "both"
+        elif has_hiring:
+            label = "hiring"
+        else:
+            label = "funding"
+        return label, text, self._is_high_confidence(text, hits)
+
+    @staticmethod
+    def _is_high_confidence(text: str, hits: set[str]) -> bool:
+        """
+        A specific AI role plus first-person hiring or a concrete round with
+        an amount is never commentary; skip the LLM check for these.
+        """
+        if "ai_role" not in hits:
+            return False
+        if _RE_WE_HIRING.search(text):
+            return True
+        return "funding_strong" in hits and bool(_RE_MONEY.search(text))
 
     @staticmethod
     def _normalize(text: str) -> str:
-        text = text.lower()
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        # Slice first, then collapse whitespace so lower() copies the shortest string.
+        return " ".join(text[:_CLASSIFY_WINDOW].split()).lower()
 
-    def _hiring_score(self, text: str) -> int:
+    def _hiring_score(self, text: str, hits: set[str] | None = None) -> int:
+        if hits is None:
+            hits = self._matcher.categories(text)
         score = 0
 
         # Explicit hiring language
-        if any(kw in text for kw in self.hiring_kw):
+        if "hiring" in hits:
             score += 2
 
         # Role noun + hiring intent together indicates real position
-        has_position_noun = any(noun in text for noun in self.position_nouns)
-        if has_position_noun:
+        if "position" in hits:
             score += 1
 
         # Strong AI role match
-        if any(marker in text for marker in self.ai_role_markers):
+        if "ai_role" in hits:
             score += 3
 
+        # The regexes below add at most 2; skip them if they can't change the outcome.
+        if score >= _SCORE_THRESHOLD or score + 2 < _SCORE_THRESHOLD:
+            return score
+
         # "we are hiring ... for/on/at" often indicates genuine company post
-        if re.search(r"\bwe('re| are)? hiring\b", text):
+        if _RE_WE_HIRING.search(text):
             score += 1
-        if re.search(r"\b(hiring|looking for|open role)\b.*\b(ai|ml|llm|nlp|vision)\b", text):
+        if _RE_HIRING_AI.search(text):
             score += 1
 
         return score
 
-    def _funding_score(self, text: str) -> int:
+    def _funding_score(self, text: str, hits: set[str] | None = None) -> int:
+        if hits is None:
+            hits = self._matcher.categories(text)
         score = 0
 
-        if any(kw in text for kw in self.funding_kw):
-            score += 2
-
-        if any(marker in text for marker in self.funding_strong_markers):
+        if "funding" in hits:
             score += 2
 
-        if re.search(r"\$\s?\d+([.,]\d+)?\s?(m|b|million|billion)\b", text):
+        if "funding_strong" in hits:
             score += 2
 
         # Ensure funding post is still AI/ML related
-        if any(kw in text for kw in ["ai", "ml", "llm", "machine learning", "artificial intelligence"]):
+        if "ai_funding" in hits:
             score += 1
 
+        # Only the money regex is left (+2); skip it if it can't change the outcome.
+        if score >= _SCORE_THRESHOLD or score + 2 < _SCORE_THRESHOLD:
+            return score
+
+        if _RE_MONEY.search(text):
+            score += 2
+
         return score
+
+
+# ------------------------------------------------------------------
+# Shared instance
+# ------------------------------------------------------------------
+
+_default: PostClassifier | None = None
+_default_lock = threading.Lock()
+
+
+def get_classifier() -> PostClassifier:
+    """Process-wide PostClassifier; keyword tables and matcher are built once."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = PostClassifier()
+    return _default
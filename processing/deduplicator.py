@@ -15,28 +15,34 @@ logger = logging.getLogger(__name__)
 
 
 def make_fingerprint(post: dict) -> str:
-    """Create a unique fingerprint for a post."""
+    """
+    Create a unique fingerprint for a post (sha256, first 16 hex chars).
+
+    The format must stay stable: these values are stored in Notion and read
+    back by load_recent_fingerprints for cross-run dedup.
+    """
     url = post.get("source_url", "")
     if url:
         return hashlib.sha256(url.encode()).hexdigest()[:16]
 
-    text = post.get("text", "")[:200]
-    platform = post.get("platform", "")
-    raw = f"{platform}:{text}"
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    h = hashlib.sha256(post.get("platform", "").encode())
+    h.update(b":")
+    h.update(post.get("text", "")[:200].encode())
+    return h.hexdigest()[:16]
 
 
 class Deduplicator:
     def __init__(self, notion: NotionStorage):
         self.notion = notion
-        self._fingerprint_cache: Optional[set[str]] = None
+        self._fingerprint_cache: Optional[frozenset[str] | set[str]] = None
 
     def load_cache(self, days: int = 7) -> None:
         """Pre-load fingerprints from Notion for fast O(1) checks."""
-        self._fingerprint_cache = self.notion.load_recent_fingerprints(days)
+        # Read-only until the first register_fingerprint() thaws it.
+        self._fingerprint_cache = frozenset(self.notion.load_recent_fingerprints(days))
 
     @property
-    def cache(self) -> set[str]:
+    def cache(self) -> frozenset[str] | set[str]:
         if self._fingerprint_cache is None:
             self.load_cache()
         assert self._fingerprint_cache is not None
@@ -55,7 +61,10 @@ class Deduplicator:
     def register_fingerprint(self, post: dict) -> str:
         """Add fingerprint to cache (call after inserting into Notion)."""
         fp = make_fingerprint(post)
-        self.cache.add(fp)
+        cache = self.cache
+        if isinstance(cache, frozenset):
+            cache = self._fingerprint_cache = set(cache)
+        cache.add(fp)
         return fp
 
     # Layer 2 -------------------------------------------------------
@@ -5,18 +5,152 @@ company name, role, funding amount, location, remote status, apply URL.
 Uses multi-strategy company extraction (regex -> URL hints -> Groq LLM fallback).
 """
 
+import functools
+import json
 import os
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from urllib.parse import urlparse
 
-import yaml
+from config.loader import load_yaml
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - optional speedup
+    re2 = None
 
 logger = logging.getLogger(__name__)
 
 _groq_client = None
 
+# ------------------------------------------------------------------
+# Precompiled patterns
+# ------------------------------------------------------------------
+
+# RE2's \w and \s are ASCII-only; widen them to match Python's Unicode
+# semantics (names with accents, non-breaking spaces in LinkedIn text).
+_RE2_CLASSES = {
+    "w": (r"[\pL\pN_]", r"\pL\pN_"),
+    "s": (r"[\s\v\pZ]", r"\s\v\pZ"),
+}
+
+
+def _compile(pattern: str, flags: str = ""):
+    """
+    Compile with RE2 (linear time, no backtracking blow-ups) when available,
+    falling back to the stdlib engine. flags are inline letters, e.g. "im".
+    """
+    if re2 is not None:
+        out, in_class, i = [], False, 0
+        while i < len(pattern):
+            ch = pattern[i]
+            if ch == "\\" and i + 1 < len(pattern):
+                nxt = pattern[i + 1]
+                out.append(_RE2_CLASSES[nxt][in_class] if nxt in _RE2_CLASSES else ch + nxt)
+                i += 2
+                continue
+            if ch == "[":
+                in_class = True
+            elif ch == "]":
+                in_class = False
+            out.append(ch)
+            i += 1
+        translated = "".join(out)
+        try:
+            return re2.compile(f"(?{flags}){translated}" if flags else translated)
+        except re2.error:
+            logger.debug("RE2 rejected %r; using re", pattern)
+    return re.compile(f"(?{flags}){pattern}" if flags else pattern)
+
+
+_COMPANY_PATTERNS = tuple(
+    _compile(p, "im")
+    for p in (
+        r"(?:join|work at|join us at|come join)\s+(@?\w[\w\s&.'-]*?)(?:\s+as\b|\s+to\b|\s*[,!.])",
+        r"we\s+at\s+(@?\w[\w\s&.'-]*?)(?:\s+are\b|\s*[,.])",
+        r"@(\w+)\s+is\s+hiring",
+        r"at\s+(@?\w[\w\s&.'-]*?),?\s+we(?:'re|\s+are)",
+        r"(?:hiring at|openings? at|positions? at)\s+(@?\w[\w\s&.'-]*?)(?:\s*[,!.]|\s+for\b)",
+        r"^(@?\w[\w\s&.'-]*?)\s+is\s+(?:hiring|looking|seeking)",
+    )
+)
+_FUNDING_PATTERNS = tuple(
+    _compile(p, "i")
+    for p in (
+        r"\$[\d,.]+\s*[BMbm](?:illion|n)?",
+        r"\$[\d,.]+\s*(?:million|billion)",
+        r"(?:raised|secured|closed)\s+\$[\d,.]+\s*[BMbm]?",
+        r"(?:series\s+[a-eA-E])\s*(?:round)?",
+        r"seed\s+round",
+        r"pre-seed",
+    )
+)
+# One alternation per check so each post is scanned once, not once per pattern.
+# Range alternatives come first so "3-5 years" yields both bounds in one match.
+_YEARS_RE = _compile(
+    "|".join(
+        (
+            r"\b(?P<r1a>\d+)\s*-\s*(?P<r1b>\d+)\s*(?:years|yrs)\s+(?:of\s+)?(?:experience|exp)\b",
+            r"\b(?P<r2a>\d+)\s+to\s+(?P<r2b>\d+)\s*(?:years|yrs)\s+(?:of\s+)?(?:experience|exp)\b",
+            r"\b(?P<y1>\d+)\+?\s*(?:years|yrs)\s+(?:of\s+)?(?:experience|exp)\b",
+            r"\bminimum\s+(?P<y2>\d+)\s*(?:years|yrs)\b",
+            r"\bat\s+least\s+(?P<y3>\d+)\s*(?:years|yrs)\b",
+            r"\brequires?\s+(?P<y4>\d+)\+?\s*(?:years|yrs)\b",
+        )
+    ),
+    "i",
+)
+_SENIOR_RE = _compile(
+    "|".join(
+        (
+            r"\b(?:senior|sr\.?|staff|principal)\s+(?:\w+\s+){0,2}(?:engineer|scientist|researcher|developer)\b",
+            r"\b(?:director|vp|head)\s+of\s+\w+",
+            r"\bcto\b",
+            r"\bchief\s+(?:technology|ai|data|science)\b",
+        )
+    )
+)
+_US_ONLY_RE = _compile(
+    "|".join(
+        (
+            r"\bus only\b", r"\busa only\b", r"\bunited states only\b",
+            r"\bu\.s\. only\b", r"\bus candidates only\b",
+            r"\bmust be based in the us\b", r"\bremote \(us\)\b",
+            r"\bus timezone only\b", r"\bonly in usa\b",
+        )
+    )
+)
+# Fallback role names when no configured role matches, in priority order.
+_JUNIOR_ROLE_MARKERS = (
+    "junior ai engineer",
+    "junior ml engineer",
+    "junior machine learning engineer",
+    "junior data scientist",
+    "entry level ai engineer",
+    "entry level machine learning engineer",
+    "new grad ai engineer",
+    "new grad ml engineer",
+    "graduate ai engineer",
+    "ml intern",
+    "ai intern",
+    "research intern",
+)
+# Posts per batched company-extraction request.
+_LLM_BATCH_SIZE = 16
+# Below this many posts, process start-up + pickling costs more than it saves.
+_PARALLEL_MIN_POSTS = 64
+
+_URL_RE = re.compile(r"https?://[^\s]+")
+_DM_RE = re.compile(r"\bdm\b|\bdirect message\b", re.IGNORECASE)
+_WWW_RE = re.compile(r"^www\.")
+
 
 def _get_groq():
     """Lazy init Groq client for company extraction fallback."""
@@ -31,49 +165,161 @@ def _get_groq():
 
 class InfoExtractor:
     def __init__(self):
-        with open("config/roles.yaml") as f:
-            self.roles = yaml.safe_load(f)["roles"]
-        with open("config/keywords.yaml") as f:
-            kw = yaml.safe_load(f)
-            self.tech_keywords = kw["tech_keywords"]
-            self.location_kw = kw["location_keywords"]
-
-    def extract(self, post: dict) -> dict:
-        """Enrich a post dict with extracted fields."""
-        text = post.get("text", "")
-        author = post.get("author_display_name", "") or post.get("author", "")
-        source_url = post.get("source_url", "") or ""
-        author_company = post.get("author_company", "")
-
-        post["company_name"] = self._company(text, author, source_url, author_company)
-        post["role"] = self._role(text)
-        post["funding_amount"] = self._funding_amount(text)
-        post["tech_keywords"] = self._tech_keywords(text)
-
-        country, remote = self._location(text)
-        post["country"] = country
-        post["remote"] = remote
-
-        apply_url, app_type = self._apply_details(text)
-        post["apply_url"] = apply_url
-        post["application_type"] = app_type
+        self.roles = load_yaml("config/roles.yaml")["roles"]
+        kw = load_yaml("config/keywords.yaml")
+        self.tech_keywords = kw["tech_keywords"]
+        self.location_kw = kw["location_keywords"]
+
+        # Tech, location and role keywords, scanned together in one pass per post.
+        self._kw_categories = {
+            "tech": self.tech_keywords,
+            "united_states": self.location_kw["united_states"],
+            "india": self.location_kw["india"],
+            "remote": self.location_kw["remote"],
+            "role": self.roles,
+            "junior": _JUNIOR_ROLE_MARKERS,
+        }
+        # Config order decides which role wins when several match.
+        self._role_rank: dict[str, int] = {}
+        for i, role in enumerate(self.roles):
+            self._role_rank.setdefault(role, i)
+        self._junior_rank = {m: i for i, m in enumerate(_JUNIOR_ROLE_MARKERS)}
+        # Lowercased once for the no-automaton fallback scan.
+        self._kw_lowered = {
+            cat: tuple((kw.lower(), kw) for kw in kws if kw)
+            for cat, kws in self._kw_categories.items()
+        }
+        # Re-extracting the same post (retries, reprocessing) skips the scan.
+        self._keyword_hits = functools.lru_cache(maxsize=1024)(self._scan_keywords)
+        self._kw_automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for cat, kws in self._kw_categories.items():
+                for kw in kws:
+                    key = kw.lower()
+                    if key:
+                        automaton.add_word(key, automaton.get(key, ()) + ((cat, kw),))
+            if len(automaton):
+                automaton.make_automaton()
+                self._kw_automaton = automaton
+
+    def extract(
+        self,
+        post: dict,
+        defer_llm: bool = False,
+        *,
+        fields: Optional[set[str]] = None,
+    ) -> dict:
+        """
+        Enrich a post dict with extracted fields.
+
+        With defer_llm=True the Groq company fallback is skipped and
+        company_name is left empty when the cheap strategies fail;
+        extract_batch() fills those in with batched LLM calls.
+
+        fields limits work to the named output keys (plus whatever they
+        depend on), e.g. fields={"company_name"} for a company-only lookup.
+        """
+        def want(*names: str) -> bool:
+            return fields is None or not fields.isdisjoint(names)
 
-        # Extract domain hint from URLs in the post for later email finding
-        post["domain_hint"] = self._domain_from_urls(text, apply_url)
+        text = post.get("text", "")
+        # Lowercased once and shared by every case-insensitive helper.
+        text_lower = text.lower()
+        # URLs are found and parsed once for the company, apply and domain helpers.
+        urls = self._extract_urls(text)
+
+        if want("company_name"):
+            author = post.get("author_display_name", "") or post.get("author", "")
+            source_url = post.get("source_url", "") or ""
+            author_company = post.get("author_company", "")
+            post["company_name"] = self._company(
+                text, author, source_url, author_company, urls, defer_llm=defer_llm
+            )
+        if fields is not None and fields <= {"company_name"}:
+            return post
+
+        kw_hits = self._keyword_hits(text_lower)
+        if want("role", "is_senior_role"):
+            post["role"] = self._role(text_lower, kw_hits)
+        if want("funding_amount"):
+            post["funding_amount"] = self._funding_amount(text)
+        if want("tech_keywords"):
+            post["tech_keywords"] = self._tech_keywords(text_lower, kw_hits)
+
+        if want("country", "remote", "location_scope"):
+            country, remote = self._location(text_lower, kw_hits)
+            post["country"] = country
+            post["remote"] = remote
+
+        if want("apply_url", "application_type", "domain_hint"):
+            apply_url, app_type = self._apply_details(text, urls)
+            post["apply_url"] = apply_url
+            post["application_type"] = app_type
+
+            # Extract domain hint from URLs in the post for later email finding
+            if want("domain_hint"):
+                post["domain_hint"] = self._domain_from_urls(text, apply_url, urls)
 
         # Eligibility signals
-        post["required_years"] = self._required_years(text)
-        post["is_senior_role"] = self._is_senior_role(text, post["role"])
-        post["is_us_only"] = self._is_us_only(text)
-        post["location_scope"] = self._location_scope(country=post["country"], remote=post["remote"])
+        if want("required_years"):
+            post["required_years"] = self._required_years(text_lower)
+        if want("is_senior_role"):
+            post["is_senior_role"] = self._is_senior_role(text_lower, post["role"])
+        if want("is_us_only"):
+            post["is_us_only"] = self._is_us_only(text_lower)
+        if want("location_scope"):
+            post["location_scope"] = self._location_scope(country=post["country"], remote=post["remote"])
 
         return post
 
+    def extract_batch(self, posts: list[dict]) -> list[dict]:
+        """extract() for many posts, sending LLM company lookups in batches."""
+        for post in posts:
+            self.extract(post, defer_llm=True)
+        self._fill_companies_from_llm(posts)
+        return posts
+
+    def extract_many(self, posts: list[dict], workers: Optional[int] = None) -> list[dict]:
+        """
+        extract_batch() with the regex work fanned out over a process pool.
+
+        Workers skip the LLM fallback; it runs batched here afterwards, so
+        there is one Groq client. Posts are updated in place, as with extract().
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 2 or len(posts) < _PARALLEL_MIN_POSTS:
+            return self.extract_batch(posts)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            for post, result in zip(posts, pool.map(_worker_extract, posts, chunksize=32)):
+                post.update(result)
+        self._fill_companies_from_llm(posts)
+        return posts
+
+    def _fill_companies_from_llm(self, posts: list[dict]) -> None:
+        """Strategies 3-4 for posts that extract(defer_llm=True) left without a company."""
+        pending = [p for p in posts if not p.get("company_name")]
+        if not pending:
+            return
+        names = self._companies_from_llm_batch([p.get("text", "") for p in pending])
+        for post, name in zip(pending, names):
+            author = post.get("author_display_name", "") or post.get("author", "")
+            post["company_name"] = name or self._company_from_author(author) or "Unknown"
+
     # ------------------------------------------------------------------
     # Company name: multi-strategy
     # ------------------------------------------------------------------
 
-    def _company(self, text: str, author: str, source_url: str, author_company: str = "") -> str:
+    def _company(
+        self,
+        text: str,
+        author: str,
+        source_url: str,
+        author_company: str = "",
+        urls: Optional[list[tuple[str, str, str]]] = None,
+        defer_llm: bool = False,
+    ) -> str:
         # Strategy 0: Company resolved from poster's LinkedIn profile (strongest for job posts)
         if author_company and len(author_company) > 1:
             return author_company
@@ -84,10 +330,14 @@ class InfoExtractor:
             return name
 
         # Strategy 2: Extract from URLs in the post (career pages, company websites)
-        name = self._company_from_post_urls(text)
+        name = self._company_from_post_urls(text, urls)
         if name:
             return name
 
+        # Caller batches strategies 3-4 itself (see extract_batch)
+        if defer_llm:
+            return ""
+
         # Strategy 3: Use Groq LLM to extract company name from the full post
         name = self._company_from_llm(text)
         if name:
@@ -102,42 +352,43 @@ class InfoExtractor:
 
     def _company_from_regex(self, text: str) -> str:
         """Extract company via common text patterns."""
-        patterns = [
-            r"(?:join|work at|join us at|come join)\s+(@?\w[\w\s&.'-]*?)(?:\s+as\b|\s+to\b|\s*[,!.])",
-            r"we\s+at\s+(@?\w[\w\s&.'-]*?)(?:\s+are\b|\s*[,.])",
-            r"@(\w+)\s+is\s+hiring",
-            r"at\s+(@?\w[\w\s&.'-]*?),?\s+we(?:'re|\s+are)",
-            r"(?:hiring at|openings? at|positions? at)\s+(@?\w[\w\s&.'-]*?)(?:\s*[,!.]|\s+for\b)",
-            r"^(@?\w[\w\s&.'-]*?)\s+is\s+(?:hiring|looking|seeking)",
-        ]
         stop_words = {"us", "our", "the", "team", "a", "an", "my", "this", "we", "i"}
 
-        for pat in patterns:
-            m = re.search(pat, text, re.IGNORECASE | re.MULTILINE)
+        for pat in _COMPANY_PATTERNS:
+            m = pat.search(text)
             if m:
                 name = m.group(1).strip("@ ").strip()
                 if name.lower() not in stop_words and len(name) > 1:
                     return name
         return ""
 
-    def _company_from_post_urls(self, text: str) -> str:
+    @staticmethod
+    def _extract_urls(text: str) -> list[tuple[str, str, str]]:
+        """(url, domain without www, lowercased url) for every URL in the text."""
+        parsed = []
+        for url in _URL_RE.findall(text):
+            url = url.rstrip(".,;:)")
+            domain = _WWW_RE.sub("", urlparse(url).netloc.lower())
+            parsed.append((url, domain, url.lower()))
+        return parsed
+
+    def _company_from_post_urls(
+        self, text: str, urls: Optional[list[tuple[str, str, str]]] = None
+    ) -> str:
         """Infer company from career/job URLs in the post."""
-        urls = re.findall(r"https?://[^\s]+", text)
+        if urls is None:
+            urls = self._extract_urls(text)
         skip = {"linkedin.com", "twitter.com", "x.com", "google.com", "github.com",
                 "forms.gle", "docs.google.com", "bit.ly", "t.co", "youtu.be"}
 
-        for url in urls:
-            url = url.rstrip(".,;:)")
-            domain = urlparse(url).netloc.lower()
-            domain = re.sub(r"^www\.", "", domain)
-
+        for url, domain, url_lower in urls:
             if any(s in domain for s in skip):
                 continue
             if not domain or "." not in domain:
                 continue
 
             # Career/job pages often reveal the company
-            if any(x in url.lower() for x in ["career", "jobs", "/job", "greenhouse", "lever.co", "apply"]):
+            if any(x in url_lower for x in ["career", "jobs", "/job", "greenhouse", "lever.co", "apply"]):
                 name = domain.split(".")[0]
                 if name and len(name) > 2:
                     return name.replace("-", " ").title()
@@ -177,6 +428,53 @@ class InfoExtractor:
 
         return ""
 
+    def _companies_from_llm_batch(self, texts: list[str]) -> list[str]:
+        """
+        Company names for several posts, one Groq request per batch.
+
+        Falls back to per-post calls for a batch whose reply can't be parsed
+        into one name per post.
+        """
+        client = _get_groq()
+        if not client:
+            return [""] * len(texts)
+
+        names: list[str] = []
+        for start in range(0, len(texts), _LLM_BATCH_SIZE):
+            chunk = texts[start:start + _LLM_BATCH_SIZE]
+            if len(chunk) == 1:
+                names.append(self._company_from_llm(chunk[0]))
+                continue
+            user = "\n\n".join(f"###POST {i}###\n{t[:500]}" for i, t in enumerate(chunk))
+            parsed = None
+            try:
+                resp = client.chat.completions.create(
+                    model="llama-3.3-70b-versatile",
+                    messages=[
+                        {"role": "system", "content": (
+                            "Extract the company name from each job/funding post. "
+                            f"Return ONLY a JSON array of {len(chunk)} strings, one per post in order. "
+                            "Use \"UNKNOWN\" for any post where you cannot determine it."
+                        )},
+                        {"role": "user", "content": user},
+                    ],
+                    temperature=0.0,
+                    max_tokens=30 * len(chunk),
+                )
+                raw = resp.choices[0].message.content or ""
+                parsed = json.loads(raw[raw.index("["):raw.rindex("]") + 1])
+            except Exception as exc:
+                logger.debug("Batched LLM company extraction failed: %s", exc)
+
+            if not isinstance(parsed, list) or len(parsed) != len(chunk):
+                names.extend(self._company_from_llm(t) for t in chunk)
+                continue
+            for name in parsed:
+                name = str(name).strip().strip('"').strip("'")
+                ok = name and name.upper() != "UNKNOWN" and 1 < len(name) < 80
+                names.append(name if ok else "")
+        return names
+
     @staticmethod
     def _company_from_author(author: str) -> str:
         """Clean up author name as company fallback."""
@@ -192,21 +490,25 @@ class InfoExtractor:
     # Domain hint from URLs in the post
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _domain_from_urls(text: str, apply_url: Optional[str] = None) -> str:
+    @classmethod
+    def _domain_from_urls(
+        cls,
+        text: str,
+        apply_url: Optional[str] = None,
+        urls: Optional[list[tuple[str, str, str]]] = None,
+    ) -> str:
         """Extract a company domain from URLs found in the post."""
         skip = {"linkedin.com", "twitter.com", "x.com", "google.com", "github.com",
                 "forms.gle", "docs.google.com", "bit.ly", "t.co", "youtu.be",
                 "medium.com", "substack.com"}
 
-        urls = re.findall(r"https?://[^\s]+", text)
+        if urls is None:
+            urls = cls._extract_urls(text)
+        domains = [domain for _, domain, _ in urls]
         if apply_url:
-            urls.insert(0, apply_url)
+            domains.insert(0, _WWW_RE.sub("", urlparse(apply_url.rstrip(".,;:)")).netloc.lower()))
 
-        for url in urls:
-            url = url.rstrip(".,;:)")
-            domain = urlparse(url).netloc.lower()
-            domain = re.sub(r"^www\.", "", domain)
+        for domain in domains:
             if domain and "." in domain and not any(s in domain for s in skip):
                 return domain
         return ""
@@ -215,28 +517,13 @@ class InfoExtractor:
     # Role extraction
     # ------------------------------------------------------------------
 
-    def _role(self, text: str) -> str:
-        text_lower = text.lower()
-        for role in self.roles:
-            if role.lower() in text_lower:
-                return role
-        junior_patterns = [
-            "junior ai engineer",
-            "junior ml engineer",
-            "junior machine learning engineer",
-            "junior data scientist",
-            "entry level ai engineer",
-            "entry level machine learning engineer",
-            "new grad ai engineer",
-            "new grad ml engineer",
-            "graduate ai engineer",
-            "ml intern",
-            "ai intern",
-            "research intern",
-        ]
-        for marker in junior_patterns:
-            if marker in text_lower:
-                return marker.title()
+    def _role(self, text_lower: str, hits: Optional[dict[str, frozenset[str]]] = None) -> str:
+        if hits is None:
+            hits = self._keyword_hits(text_lower)
+        if hits["role"]:
+            return min(hits["role"], key=self._role_rank.__getitem__)
+        if hits["junior"]:
+            return min(hits["junior"], key=self._junior_rank.__getitem__).title()
         return ""
 
     # ------------------------------------------------------------------
@@ -244,47 +531,56 @@ class InfoExtractor:
     # ------------------------------------------------------------------
 
     def _funding_amount(self, text: str) -> str:
-        patterns = [
-            r"\$[\d,.]+\s*[BMbm](?:illion|n)?",
-            r"\$[\d,.]+\s*(?:million|billion)",
-            r"(?:raised|secured|closed)\s+\$[\d,.]+\s*[BMbm]?",
-            r"(?:series\s+[a-eA-E])\s*(?:round)?",
-            r"seed\s+round",
-            r"pre-seed",
-        ]
         findings = []
-        for pat in patterns:
-            m = re.search(pat, text, re.IGNORECASE)
+        for pat in _FUNDING_PATTERNS:
+            m = pat.search(text)
             if m:
                 findings.append(m.group(0).strip())
         return "; ".join(findings) if findings else ""
 
-    def _tech_keywords(self, text: str) -> str:
-        text_lower = text.lower()
-        found = sorted({kw for kw in self.tech_keywords if kw.lower() in text_lower})
-        return ", ".join(found)
-
-    def _location(self, text: str) -> tuple[Optional[str], bool]:
-        text_lower = text.lower()
-        is_remote = any(kw.lower() in text_lower for kw in self.location_kw["remote"])
-
-        for kw in self.location_kw["united_states"]:
-            if kw.lower() in text_lower:
-                return "United States", is_remote
-        for kw in self.location_kw["india"]:
-            if kw.lower() in text_lower:
-                return "India", is_remote
+    def _scan_keywords(self, text_lower: str) -> dict[str, frozenset[str]]:
+        """
+        Matched keywords (original spelling) per category. Reached through
+        the memoized self._keyword_hits, so results are shared and frozen.
+        """
+        if self._kw_automaton is not None:
+            hits: dict[str, set[str]] = {cat: set() for cat in self._kw_categories}
+            for _, entries in self._kw_automaton.iter(text_lower):
+                for cat, kw in entries:
+                    hits[cat].add(kw)
+            return {cat: frozenset(found) for cat, found in hits.items()}
+        return {
+            cat: frozenset(kw for key, kw in pairs if key in text_lower)
+            for cat, pairs in self._kw_lowered.items()
+        }
+
+    def _tech_keywords(self, text_lower: str, hits: Optional[dict[str, frozenset[str]]] = None) -> str:
+        if hits is None:
+            hits = self._keyword_hits(text_lower)
+        return ", ".join(sorted(hits["tech"]))
+
+    def _location(
+        self, text_lower: str, hits: Optional[dict[str, frozenset[str]]] = None
+    ) -> tuple[Optional[str], bool]:
+        if hits is None:
+            hits = self._keyword_hits(text_lower)
+        is_remote = bool(hits["remote"])
+
+        if hits["united_states"]:
+            return "United States", is_remote
+        if hits["india"]:
+            return "India", is_remote
         if is_remote:
             return None, True
         return None, False
 
-    def _apply_details(self, text: str) -> tuple[Optional[str], str]:
-        urls = re.findall(r"https?://[^\s]+", text)
-        for url in urls:
-            url = url.rstrip(".,;:)")
-            domain = urlparse(url).netloc.lower()
-
-            if any(x in url.lower() for x in ["career", "jobs", "/job", "apply"]):
+    def _apply_details(
+        self, text: str, urls: Optional[list[tuple[str, str, str]]] = None
+    ) -> tuple[Optional[str], str]:
+        if urls is None:
+            urls = self._extract_urls(text)
+        for url, domain, url_lower in urls:
+            if any(x in url_lower for x in ["career", "jobs", "/job", "apply"]):
                 return url, "careers_page"
             if "greenhouse" in domain:
                 return url, "careers_page"
@@ -295,7 +591,7 @@ class InfoExtractor:
             if "forms.gle" in domain or "docs.google.com/forms" in url:
                 return url, "google_form"
 
-        if re.search(r"\bdm\b|\bdirect message\b", text, re.IGNORECASE):
+        if _DM_RE.search(text):
             return None, "dm"
         return None, "unknown"
 
@@ -303,27 +599,15 @@ class InfoExtractor:
     # Eligibility signals
     # ------------------------------------------------------------------
 
-    def _required_years(self, text: str) -> Optional[int]:
-        patterns = [
-            r"\b(\d+)\+?\s*(?:years|yrs)\s+(?:of\s+)?(?:experience|exp)\b",
-            r"\bminimum\s+(\d+)\s*(?:years|yrs)\b",
-            r"\bat\s+least\s+(\d+)\s*(?:years|yrs)\b",
-            r"\brequires?\s+(\d+)\+?\s*(?:years|yrs)\b",
-            r"\b(\d+)\s*-\s*(\d+)\s*(?:years|yrs)\s+(?:of\s+)?(?:experience|exp)\b",
-            r"\b(\d+)\s+to\s+(\d+)\s*(?:years|yrs)\s+(?:of\s+)?(?:experience|exp)\b",
-        ]
-        text_lower = text.lower()
+    def _required_years(self, text_lower: str) -> Optional[int]:
         best: Optional[int] = None
-        for pat in patterns:
-            for m in re.finditer(pat, text_lower, re.IGNORECASE):
-                if m.lastindex is None:
-                    continue
-                val = int(m.group(1))
-                if best is None or val > best:
-                    best = val
+        for m in _YEARS_RE.finditer(text_lower):
+            val = max(int(g) for g in m.groupdict().values() if g)
+            if best is None or val > best:
+                best = val
         return best
 
-    def _is_senior_role(self, text: str, extracted_role: str = "") -> bool:
+    def _is_senior_role(self, text_lower: str, extracted_role: str = "") -> bool:
         title_markers = [
             "senior", "sr ", "sr.", "staff ", "principal",
             "lead ", "manager", "director", "vp ", "vice president",
@@ -334,24 +618,10 @@ class InfoExtractor:
             role_lower = extracted_role.lower()
             return any(m in role_lower for m in title_markers)
 
-        text_lower = text.lower()
-        senior_role_patterns = [
-            r"\b(?:senior|sr\.?|staff|principal)\s+(?:\w+\s+){0,2}(?:engineer|scientist|researcher|developer)\b",
-            r"\b(?:director|vp|head)\s+of\s+\w+",
-            r"\bcto\b",
-            r"\bchief\s+(?:technology|ai|data|science)\b",
-        ]
-        return any(re.search(pat, text_lower) for pat in senior_role_patterns)
+        return bool(_SENIOR_RE.search(text_lower))
 
-    def _is_us_only(self, text: str) -> bool:
-        text_lower = text.lower()
-        us_only_patterns = [
-            r"\bus only\b", r"\busa only\b", r"\bunited states only\b",
-            r"\bu\.s\. only\b", r"\bus candidates only\b",
-            r"\bmust be based in the us\b", r"\bremote \(us\)\b",
-            r"\bus timezone only\b", r"\bonly in usa\b",
-        ]
-        return any(re.search(pat, text_lower) for pat in us_only_patterns)
+    def _is_us_only(self, text_lower: str) -> bool:
+        return bool(_US_ONLY_RE.search(text_lower))
 
     @staticmethod
     def _location_scope(country: Optional[str], remote: bool) -> str:
@@ -362,3 +632,20 @@ class InfoExtractor:
         if country:
             return "non_us"
         return "unknown"
+
+
+# ------------------------------------------------------------------
+# Process-pool workers (see InfoExtractor.extract_many)
+# ------------------------------------------------------------------
+
+_worker_extractor: Optional[InfoExtractor] = None
+
+
+def _init_worker() -> None:
+    global _worker_extractor
+    _worker_extractor = InfoExtractor()
+
+
+def _worker_extract(post: dict) -> dict:
+    assert _worker_extractor is not None
+    return _worker_extractor.extract(post, defer_llm=True)
@@ -8,15 +8,16 @@ research quota to keep traffic low while maximizing precision.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 from typing import Optional
 
 import requests
-import yaml
-from bs4 import BeautifulSoup
 
+from config.loader import load_yaml
 from research.email_finder import EmailFinder
 from research.email_research_quota import EmailResearchQuota
 
@@ -29,6 +30,50 @@ HEADERS = {
     )
 }
 
+# One task per evidence source in find_best_email.
+_SEARCH_WORKERS = 4
+# Keep-alive connections to the search endpoint across lookups.
+_http = requests.Session()
+# Script/style bodies and tags; replaced by spaces to leave the visible text.
+_MARKUP_RE = re.compile(
+    r"<script\b.*?</script>|<style\b.*?</style>|<[^>]+>", re.IGNORECASE | re.DOTALL
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def _search_page_text(query: str) -> str:
+    """DuckDuckGo HTML results as text. Raises on failure so errors aren't cached."""
+    url = f"https://html.duckduckgo.com/html/?q={requests.utils.requote_uri(query)}"
+    resp = _http.get(url, headers=HEADERS, timeout=10)
+    # DuckDuckGo serves its rate-limit/anomaly page as a 2xx (202); anything
+    # but a 200 must raise, or that page would be cached for the process.
+    if resp.status_code != 200:
+        raise requests.HTTPError(f"DuckDuckGo returned {resp.status_code}", response=resp)
+    # Callers only substring-match and regex the text, so no parse tree.
+    return " ".join(unescape(_MARKUP_RE.sub(" ", resp.text)).split())
+
+
+@functools.lru_cache(maxsize=1024)
+def _email_re_for(domain: str) -> re.Pattern[str]:
+    """Address pattern for one (lowercase) domain, compiled once."""
+    return re.compile(r"[a-z0-9._%+-]+@" + re.escape(domain) + r"\b")
+
+
+# Every ASCII byte except a-z, for bytes.translate(None, delete).
+_NON_LOWER_ASCII = bytes(c for c in range(128) if not 97 <= c <= 122)
+
+
+def _ascii_letters(word: str) -> str:
+    """Lowercase word reduced to its a-z characters."""
+    return word.lower().encode("ascii", "ignore").translate(None, _NON_LOWER_ASCII).decode()
+
+
+class _PatternFields(dict):
+    """format_map() values; unknown placeholders are left as written."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
 
 class AccurateEmailFinder:
     """
@@ -38,10 +83,8 @@ class AccurateEmailFinder:
     """
 
     def __init__(self):
-        with open("config/email_patterns.yaml") as f:
-            self.patterns = yaml.safe_load(f)["patterns"]
-        with open("config/settings.yaml") as f:
-            cfg = yaml.safe_load(f)
+        self.patterns = load_yaml("config/email_patterns.yaml")["patterns"]
+        cfg = load_yaml("config/settings.yaml")
 
         rcfg = cfg.get("research", {})
         self.max_web_queries_per_contact = int(
@@ -51,6 +94,9 @@ class AccurateEmailFinder:
             daily_limit=int(rcfg.get("accurate_email_daily_limit", 20))
         )
         self.basic = EmailFinder()
+        self._search_pool = ThreadPoolExecutor(
+            max_workers=_SEARCH_WORKERS, thread_name_prefix="email-search"
+        )
 
     def scrape_website_emails(self, domain: str) -> list[str]:
         """Compatibility helper used by existing pipelines."""
@@ -92,70 +138,76 @@ class AccurateEmailFinder:
 
         self.quota.increment()
 
-        scores: dict[str, int] = defaultdict(int)
-        reasons: dict[str, list[str]] = defaultdict(list)
+        # Only candidates can win, so evidence for any other address is
+        # dropped; scores and reasons are indexed by candidate position.
+        index = {c: i for i, c in enumerate(candidates)}
+        scores = [0] * len(candidates)
+        reasons: list[list[str]] = [[] for _ in candidates]
+
+        def award(email: str, points: int, reason: str) -> None:
+            i = index.get(email)
+            if i is not None:
+                scores[i] += points
+                reasons[i].append(reason)
 
         # Base prior: favor first.last slightly.
-        scores[candidates[0]] += 8
-        reasons[candidates[0]].append("default_pattern_prior")
+        award(candidates[0], 8, "default_pattern_prior")
+
+        # The four evidence sources are independent network lookups; start
+        # them together so the wait is the slowest one, not the sum.
+        pool = self._search_pool
+        website_future = pool.submit(self.basic.scrape_website_emails, company_domain)
+        mentions_future = pool.submit(
+            self._search_web_candidate_mentions,
+            candidates[: self.max_web_queries_per_contact],
+        )
+        contextual_future = pool.submit(
+            self._search_web_contextual, first, last, company_domain, company_name
+        )
+        smtp_future = pool.submit(
+            self._smtp_verified_candidate, candidates, company_domain
+        )
 
         # Evidence 1: Website match from known public emails.
-        website_emails = self.basic.scrape_website_emails(company_domain)
-        website_match = self._match_known_email(first, last, website_emails)
+        website_match = self._match_known_email(first, last, website_future.result())
         if website_match:
-            scores[website_match] += 90
-            reasons[website_match].append("website_exact_or_pattern_match")
+            award(website_match, 90, "website_exact_or_pattern_match")
 
         # Evidence 2: Search web for direct candidate mentions (high precision).
-        mention_hits = self._search_web_candidate_mentions(
-            candidates[: self.max_web_queries_per_contact]
-        )
-        for email in mention_hits:
-            if email in scores or email in candidates:
-                scores[email] += 75
-                reasons[email].append("direct_web_mention")
+        for email in mentions_future.result():
+            award(email, 75, "direct_web_mention")
 
         # Evidence 3: Search web for name + domain and extract emails.
-        contextual_hits = self._search_web_contextual(
-            first, last, company_domain, company_name
-        )
-        for email in contextual_hits:
-            if email in scores or email in candidates:
-                scores[email] += 55
-                reasons[email].append("name_domain_context_match")
+        for email in contextual_future.result():
+            award(email, 55, "name_domain_context_match")
 
         # Evidence 4: SMTP verification (bonus; often blocked by networks).
-        smtp_verified = self._smtp_verified_candidate(candidates, company_domain)
+        smtp_verified = smtp_future.result()
         if smtp_verified:
-            scores[smtp_verified] += 65
-            reasons[smtp_verified].append("smtp_verified")
+            award(smtp_verified, 65, "smtp_verified")
 
         # Small penalties for very unlikely patterns.
         for email in candidates:
             local = email.split("@")[0]
             if len(local) <= 2:
-                scores[email] -= 8
-                reasons[email].append("short_local_penalty")
+                award(email, -8, "short_local_penalty")
             if local in {"admin", "contact", "careers", "jobs", "hr"}:
-                scores[email] -= 30
-                reasons[email].append("generic_alias_penalty")
+                award(email, -30, "generic_alias_penalty")
 
-        # Ensure every candidate at least exists in scores map.
-        for c in candidates:
-            _ = scores[c]
-
-        best = max(candidates, key=lambda c: scores[c])
-        best_score = scores[best]
+        best_i = max(range(len(candidates)), key=scores.__getitem__)
+        best = candidates[best_i]
+        best_score = scores[best_i]
+        best_reasons = reasons[best_i]
         confidence = self._score_to_confidence(best_score)
 
-        method = self._pick_method(reasons[best])
+        method = self._pick_method(best_reasons)
         logger.info(
             "[email-accurate] %s -> %s (%s score=%d reasons=%s)",
             full_name,
             best,
             confidence,
             best_score,
-            ",".join(reasons[best]) if reasons[best] else "pattern_guess",
+            ",".join(best_reasons) if best_reasons else "pattern_guess",
         )
 
         return {
@@ -171,28 +223,27 @@ class AccurateEmailFinder:
         return self.find_best_email(full_name=full_name, company_domain=domain)
 
     def _normalize_name(self, full_name: str) -> tuple[str, str]:
-        cleaned = re.sub(r"\s+", " ", full_name or "").strip()
-        if not cleaned:
+        parts = (full_name or "").split()
+        if not parts:
             return "", ""
-        parts = cleaned.split(" ")
-        first = re.sub(r"[^a-z]", "", parts[0].lower())
-        last = re.sub(r"[^a-z]", "", parts[-1].lower()) if len(parts) > 1 else ""
+        first = _ascii_letters(parts[0])
+        last = _ascii_letters(parts[-1]) if len(parts) > 1 else ""
         return first, last
 
     def _build_candidates(self, first: str, last: str, domain: str) -> list[str]:
-        f = first[0] if first else ""
-        l = last[0] if last else ""
-        candidates: list[str] = []
-        for pattern in self.patterns:
-            email = (
-                pattern.replace("{first}", first)
-                .replace("{last}", last)
-                .replace("{f}", f)
-                .replace("{l}", l)
-                .replace("{domain}", domain)
-            )
-            if email and email not in candidates:
-                candidates.append(email)
+        fields = _PatternFields(
+            first=first,
+            last=last,
+            f=first[:1],
+            l=last[:1],
+            domain=domain,
+        )
+        # One format_map pass per pattern; dict.fromkeys dedupes in order.
+        candidates = [
+            email
+            for email in dict.fromkeys(p.format_map(fields) for p in self.patterns)
+            if email
+        ]
         if not candidates and first and domain:
             candidates.append(f"{first}@{domain}")
         return candidates
@@ -214,15 +265,21 @@ class AccurateEmailFinder:
         return ""
 
     def _search_web_candidate_mentions(self, candidates: list[str]) -> set[str]:
-        hits: set[str] = set()
-        for candidate in candidates:
-            query = f"\"{candidate}\""
-            html = self._duckduckgo_html_search(query)
-            if not html:
-                continue
-            if candidate.lower() in html.lower():
-                hits.add(candidate)
-        return hits
+        if not candidates:
+            return set()
+        # One OR query covers every candidate; one regex pass finds which appear.
+        query = " OR ".join(f"\"{candidate}\"" for candidate in candidates)
+        html = self._duckduckgo_html_search(query)
+        if not html:
+            return set()
+        pattern = re.compile(
+            "|".join(re.escape(c) for c in sorted(candidates, key=len, reverse=True)),
+            re.IGNORECASE,
+        )
+        # Matches are case-insensitive; hand back the caller's own strings,
+        # which find_best_email uses as index keys.
+        original = {c.lower(): c for c in candidates}
+        return {original[m.lower()] for m in pattern.findall(html)}
 
     def _search_web_contextual(
         self, first: str, last: str, domain: str, company_name: str
@@ -231,22 +288,11 @@ class AccurateEmailFinder:
         html = self._duckduckgo_html_search(query)
         if not html:
             return set()
-        emails = set(
-            re.findall(
-                r"[a-zA-Z0-9._%+-]+@" + re.escape(domain) + r"\b",
-                html,
-            )
-        )
-        return {e.lower() for e in emails}
+        return set(_email_re_for(domain.lower()).findall(html.lower()))
 
     def _duckduckgo_html_search(self, query: str) -> str:
-        url = f"https://html.duckduckgo.com/html/?q={requests.utils.requote_uri(query)}"
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=10)
-            if resp.status_code != 200:
-                return ""
-            soup = BeautifulSoup(resp.text, "html.parser")
-            return soup.get_text(" ", strip=True)
+            return _search_page_text(query)
         except Exception:
             return ""
 
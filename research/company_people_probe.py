@@ -9,15 +9,20 @@ Used in two places:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Optional
-from urllib.parse import unquote, urlparse, parse_qs
+from urllib.parse import unquote_to_bytes
 
 import requests
-import yaml
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from config.loader import load_yaml
 from research.accurate_email_finder import AccurateEmailFinder
 from research.company_variants import get_company_name_variants
 from research.domain_finder import DomainFinder
@@ -34,7 +39,7 @@ HEADERS = {
 }
 
 # Common single first names — used to filter out person-name leads.
-_COMMON_FIRST_NAMES = {
+_COMMON_FIRST_NAMES = frozenset({
     "james", "john", "robert", "michael", "william", "david", "richard",
     "joseph", "thomas", "charles", "mary", "patricia", "jennifer", "linda",
     "barbara", "elizabeth", "susan", "jessica", "sarah", "karen", "lauryn",
@@ -49,16 +54,54 @@ _COMMON_FIRST_NAMES = {
     "noah", "ethan", "liam", "mason", "oliver", "lucas", "aiden", "carter",
     "sebastian", "finn", "owen", "julian", "gabriel", "angel", "dylan",
     "ryan", "leo", "aaron", "eli",
-}
+})
 
 # Company name suffixes that confirm it is a company, not a person.
-_COMPANY_SUFFIXES = {
+_COMPANY_SUFFIXES = frozenset({
     "ai", "inc", "llc", "ltd", "corp", "technologies", "tech", "labs",
     "solutions", "systems", "group", "platform", "platforms", "health",
     "finance", "capital", "ventures", "studio", "studios",
-}
-
-
+})
+
+_DIGITS = frozenset("0123456789")
+
+_DISCOVERY_WORKERS = 8
+
+# Shared keep-alive session for the discovery searches. Rate-limit and
+# transient gateway errors are retried with exponential backoff.
+_http = requests.Session()
+_http.headers.update(HEADERS)
+_http.mount(
+    "https://",
+    HTTPAdapter(
+        # One socket per concurrent variant search (see _variant_pool).
+        pool_maxsize=_DISCOVERY_WORKERS,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503),
+            allowed_methods=frozenset({"GET"}),
+        ),
+    ),
+)
+# Name variants of one company are searched concurrently on this pool.
+_variant_pool = ThreadPoolExecutor(
+    max_workers=_DISCOVERY_WORKERS, thread_name_prefix="li-discovery"
+)
+# Each variant search fans out to both engines on this separate pool, so a
+# full variant pool can never wait on itself.
+_engine_pool = ThreadPoolExecutor(
+    max_workers=2 * _DISCOVERY_WORKERS, thread_name_prefix="li-engine"
+)
+
+# Slug stops at path/query delimiters and at HTML/query-string punctuation,
+# so matches taken straight from raw result pages don't swallow markup.
+_LI_COMPANY_RE = re.compile(
+    rb"https?://(?:[a-z]{2,3}\.)?linkedin\.com/company/[^/?#\s\"'<>&]+"
+)
+
+
+@functools.lru_cache(maxsize=2048)
 def is_valid_company_name(name: str) -> bool:
     """
     Return False if the name looks like a person's first name or is too
@@ -76,84 +119,137 @@ def is_valid_company_name(name: str) -> bool:
     # Single short word with no company suffix signals — likely a person.
     if len(words) == 1 and len(words[0]) <= 6:
         # Allow if it has a digit (e.g. "h2o") or matches a company suffix.
-        has_digit = any(c.isdigit() for c in words[0])
-        is_suffix = words[0] in _COMPANY_SUFFIXES
-        if not has_digit and not is_suffix:
+        if _DIGITS.isdisjoint(words[0]) and words[0] not in _COMPANY_SUFFIXES:
             return False
     return True
 
 
-def _extract_linkedin_company_url(text: str) -> str:
+def _linkedin_company_url_in_page(body: bytes) -> str:
     """
-    Extract a LinkedIn company URL from arbitrary text/href, handling
-    DuckDuckGo redirect wrappers like:
+    First LinkedIn company URL in a raw search result page, including ones
+    behind DuckDuckGo redirect wrappers like
       https://duckduckgo.com/l/?uddg=https%3A%2F%2Fwww.linkedin.com%2Fcompany%2Fopenai%2F
+    Works on the undecoded bytes; only the matched URL is turned into text.
     """
-    # First try URL-decoded version.
-    decoded = unquote(text)
-    match = re.search(
-        r"https?://(?:[a-z]{2,3}\.)?linkedin\.com/company/[^/?#\s]+",
-        decoded,
-    )
-    if match:
-        url = match.group(0).rstrip("/")
-        return url + "/"
+    match = _LI_COMPANY_RE.search(unquote_to_bytes(body))
+    if not match:
+        return ""
+    return match.group(0).decode("utf-8", "replace").rstrip("/") + "/"
+
+
+class _SearchFailed(Exception):
+    """A discovery search errored, so an empty result must not be cached."""
+
 
-    # Try extracting the uddg= query param value (DuckDuckGo redirect).
+# Discovery results by normalized name: (url or "" for a clean miss, stored_at).
+# Entries expire so a long-running --schedule process picks up companies whose
+# LinkedIn page gets indexed later; misses expire sooner than hits.
+_DISCOVERY_HIT_TTL = 24 * 3600
+_DISCOVERY_MISS_TTL = 6 * 3600
+_DISCOVERY_CACHE_SIZE = 4096
+_discovered: dict[str, tuple[str, float]] = {}
+
+# Searches currently running, by normalized name. Concurrent lookups of the
+# same variant (common across companies) wait on one search instead of
+# racing the lru_cache with duplicate round trips.
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _discover_linkedin_url_for_name(search_name: str) -> str:
+    """Search DuckDuckGo and Google for one company name. Returns URL or \"\"."""
+    key = " ".join(search_name.split()).lower()
+    with _inflight_lock:
+        cached = _discovered.get(key)
+        if cached is not None:
+            url, stored_at = cached
+            ttl = _DISCOVERY_HIT_TTL if url else _DISCOVERY_MISS_TTL
+            if time.monotonic() - stored_at < ttl:
+                return url
+            del _discovered[key]
+        running = _inflight.get(key)
+        if running is None:
+            running = _inflight[key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return running.result()
+
+    found = ""
+    cacheable = False
     try:
-        parsed = urlparse(text)
-        params = parse_qs(parsed.query)
-        for key in ("uddg", "u", "url"):
-            vals = params.get(key, [])
-            if vals:
-                inner = unquote(vals[0])
-                match = re.search(
-                    r"https?://(?:[a-z]{2,3}\.)?linkedin\.com/company/[^/?#\s]+",
-                    inner,
-                )
-                if match:
-                    url = match.group(0).rstrip("/")
-                    return url + "/"
-    except Exception:
+        found = _discover(key)
+        cacheable = True
+    except _SearchFailed:
         pass
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+            if cacheable:
+                if len(_discovered) >= _DISCOVERY_CACHE_SIZE:
+                    # Oldest insertion first.
+                    del _discovered[next(iter(_discovered))]
+                _discovered[key] = (found, time.monotonic())
+        running.set_result(found)
+    return found
+
+
+def _discover(search_name: str) -> str:
+    """
+    One discovery for a normalized name. Hits and clean misses are cached by
+    the caller; a miss where either search failed raises _SearchFailed so it
+    is retried later.
 
+    DuckDuckGo and Google are queried at once and the first hit wins, so a
+    rate-limited or empty engine no longer adds its latency to the other's.
+    """
+    futures = [
+        _engine_pool.submit(_search_duckduckgo, search_name),
+        _engine_pool.submit(_search_google, search_name),
+    ]
+    failed = False
+    for future in as_completed(futures):
+        try:
+            found = future.result()
+        except _SearchFailed:
+            failed = True
+            continue
+        if found:
+            for other in futures:
+                other.cancel()
+            return found
+    if failed:
+        raise _SearchFailed(search_name)
     return ""
 
 
-def _discover_linkedin_url_for_name(search_name: str) -> str:
-    """Try DuckDuckGo then Google for one company name. Returns URL or \"\"."""
+def _search_duckduckgo(search_name: str) -> str:
     q = f"site:linkedin.com/company {search_name}"
     ddg_url = f"https://html.duckduckgo.com/html/?q={requests.utils.requote_uri(q)}"
     try:
-        resp = requests.get(ddg_url, headers=HEADERS, timeout=10)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, "html.parser")
-            for a in soup.select("a.result__a[href], a[href]"):
-                href = a.get("href", "")
-                found = _extract_linkedin_company_url(href)
-                if found:
-                    return found
-            found = _extract_linkedin_company_url(resp.text)
-            if found:
-                return found
+        resp = _http.get(ddg_url, timeout=10)
     except Exception as exc:
         logger.debug("DuckDuckGo company search failed for '%s': %s", search_name, exc)
+        raise _SearchFailed(search_name) from exc
+    if resp.status_code != 200:
+        raise _SearchFailed(search_name)
+    # One regex sweep over the URL-decoded page covers every result
+    # href, including DuckDuckGo's uddg= redirect wrappers.
+    return _linkedin_company_url_in_page(resp.content)
 
+
+def _search_google(search_name: str) -> str:
     g_q = f'site:linkedin.com/company "{search_name}"'
     google_url = f"https://www.google.com/search?q={requests.utils.requote_uri(g_q)}&num=5"
     try:
-        resp = requests.get(google_url, headers=HEADERS, timeout=10)
-        if resp.status_code == 200:
-            soup = BeautifulSoup(resp.text, "html.parser")
-            for a in soup.select("a[href]"):
-                href = a.get("href", "")
-                found = _extract_linkedin_company_url(href)
-                if found:
-                    return found
+        resp = _http.get(google_url, timeout=10)
     except Exception as exc:
         logger.debug("Google company search failed for '%s': %s", search_name, exc)
-
-    return ""
+        raise _SearchFailed(search_name) from exc
+    if resp.status_code != 200:
+        raise _SearchFailed(search_name)
+    return _linkedin_company_url_in_page(resp.content)
 
 
 def discover_company_linkedin_url(company_name: str) -> str:
@@ -162,15 +258,20 @@ def discover_company_linkedin_url(company_name: str) -> str:
 
     Tries the name and variants (e.g. "Tactful AI" -> also "Tactful") so we
     match when X uses @Tactfulai but LinkedIn lists the company as "Tactful".
-    Strategy: for each variant, DuckDuckGo then Google; return first found.
+    Strategy: for each variant (concurrently), DuckDuckGo and Google;
+    return the first found in variant order.
     """
     variants = get_company_name_variants(company_name)
     if not variants:
         return ""
 
-    for search_name in variants:
-        found = _discover_linkedin_url_for_name(search_name)
+    # All variants are searched at once; the first in priority order wins.
+    futures = [_variant_pool.submit(_discover_linkedin_url_for_name, v) for v in variants]
+    for search_name, future in zip(variants, futures):
+        found = future.result()
         if found:
+            for pending in futures:
+                pending.cancel()
             if search_name != (variants[0] or "").strip():
                 logger.info(
                     "Discovered LinkedIn URL for '%s' via variant '%s': %s",
@@ -191,6 +292,22 @@ def discover_company_linkedin_url(company_name: str) -> str:
     return ""
 
 
+def discover_company_linkedin_urls(
+    company_names: list[str], max_workers: int = 4
+) -> dict[str, str]:
+    """
+    Run discover_company_linkedin_url for many companies in parallel.
+
+    Returns {company_name: url_or_empty}. The lookups are independent HTTP
+    round-trips, so a small thread pool overlaps their latency.
+    """
+    if not company_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(company_names)))) as pool:
+        urls = pool.map(discover_company_linkedin_url, company_names)
+        return dict(zip(company_names, urls))
+
+
 # Role search terms used on the company People tab, in priority order.
 # We search for these one at a time until we have enough profiles.
 PEOPLE_SEARCH_TERMS = [
@@ -204,6 +321,9 @@ PEOPLE_SEARCH_TERMS = [
     "find talent",
 ]
 
+# Upper bound on lazy-load scrolls per people search page.
+_MAX_CARD_SCROLLS = 8
+
 _RECRUITER_HEADLINE_MARKERS = [
     "recruiter", "recruiting", "talent acquisition", "talent partner",
     "hiring manager", "hr ", "hr manager", "human resources",
@@ -216,9 +336,18 @@ _RECRUITER_HEADLINE_MARKERS = [
 ]
 
 
+# All markers in one alternation: a single scan per headline.
+_RECRUITER_HEADLINE_RE = re.compile(
+    "|".join(re.escape(m) for m in _RECRUITER_HEADLINE_MARKERS)
+)
+
+
+_NAME_STRIP_RE = re.compile(r"[^\w\s\-'.À-ÿ]+")
+_WS_RE = re.compile(r"\s+")
+
+
 def _is_hiring_relevant_headline(headline: str) -> bool:
-    lower = headline.lower()
-    return any(m in lower for m in _RECRUITER_HEADLINE_MARKERS)
+    return _RECRUITER_HEADLINE_RE.search(headline.lower()) is not None
 
 
 class LinkedInCompanyPeopleProbe(BaseScraper):
@@ -255,7 +384,7 @@ class LinkedInCompanyPeopleProbe(BaseScraper):
                     continue
                 name = (await el.inner_text()).strip()
                 if name:
-                    return re.sub(r"\s+", " ", name)
+                    return _WS_RE.sub(" ", name)
             except Exception:
                 continue
         return ""
@@ -304,11 +433,7 @@ class LinkedInCompanyPeopleProbe(BaseScraper):
             except Exception:
                 pass
 
-            # Scroll to reveal lazy-loaded cards
-            await self.scroll_to_bottom()
-            await self.random_delay(1, 3)
-
-            links = await self._extract_people_card_links()
+            links = await self._card_links_until(limit - len(collected), seen)
             new = [lnk for lnk in links if lnk not in seen]
             seen.update(new)
             collected.extend(new)
@@ -348,16 +473,37 @@ class LinkedInCompanyPeopleProbe(BaseScraper):
         except Exception:
             pass
 
-        await self.scroll_to_bottom()
-        await self.random_delay(1, 3)
-        links = await self._extract_people_card_links()
+        links = await self._card_links_until(limit, set())
         return links[:limit]
 
+    async def _card_links_until(self, needed: int, seen: set[str]) -> list[str]:
+        """
+        People-card links on the current page, scrolling only while fewer
+        than `needed` unseen ones are rendered. Stops after two scrolls in a
+        row reveal nothing new.
+        """
+        links = await self._extract_people_card_links()
+        stalls = scrolls = 0
+        while (
+            sum(lnk not in seen for lnk in links) < needed
+            and stalls < 2
+            and scrolls < _MAX_CARD_SCROLLS
+        ):
+            # Scroll a viewport at a time to reveal lazy-loaded cards.
+            await self.page.evaluate("window.scrollBy(0, window.innerHeight)")
+            await self.random_delay(1, 2)
+            scrolls += 1
+            more = await self._extract_people_card_links()
+            stalls = stalls + 1 if len(more) <= len(links) else 0
+            links = more
+        return links
+
     async def _extract_people_card_links(self) -> list[str]:
         """
         Extract /in/ profile links from people result cards ONLY.
 
-        LinkedIn company people page card containers (tried in order):
+        One combined selector matches /in/ anchors inside any of the
+        LinkedIn company people page card containers:
           - ul.org-people-profiles-module__profile-list > li  (classic)
           - ul[class*="org-people__profile-list"] > li
           - .org-people-profile-card  (individual card)
@@ -366,54 +512,43 @@ class LinkedInCompanyPeopleProbe(BaseScraper):
         """
         script = r"""
         (() => {
-          const out = [];
-          const seen = new Set();
-
-          function addHref(href) {
-            if (!href || !href.includes('/in/')) return;
-            if (href.startsWith('/')) href = 'https://www.linkedin.com' + href;
-            href = href.split('?')[0].split('#')[0];
-            // Skip bare /in/ and nav-only links
-            const slug = href.replace(/.*\/in\//, '').replace(/\/$/, '');
-            if (!slug || slug.length < 2) return;
-            if (!seen.has(href)) { seen.add(href); out.push(href); }
-          }
-
-          // --- Scoped card selectors (most specific first) ---
-          const cardSelectors = [
-            'ul.org-people-profiles-module__profile-list li a[href*="/in/"]',
-            'ul[class*="org-people__profile-list"] li a[href*="/in/"]',
-            '.org-people-profile-card a[href*="/in/"]',
-            '[data-test-org-people-profile-card] a[href*="/in/"]',
-            'section[class*="org-people"] a[href*="/in/"]',
-            '.artdeco-card a[href*="/in/"]',
-          ];
-
-          let found = false;
-          for (const sel of cardSelectors) {
-            const els = document.querySelectorAll(sel);
-            if (els.length > 0) {
-              els.forEach(a => addHref(a.href || a.getAttribute('href') || ''));
-              found = true;
+          // Anchors inside people result cards, as one selector list.
+          const CARD_LINKS = [
+            'ul.org-people-profiles-module__profile-list li',
+            'ul[class*="org-people__profile-list"] li',
+            '.org-people-profile-card',
+            '[data-test-org-people-profile-card]',
+            'section[class*="org-people"]',
+            '.artdeco-card',
+          ].map(card => card + ' a[href*="/in/"]').join(', ');
+          const SLUG_RE = /\/in\/([^/?#]+)/;
+
+          function collect(anchors, skipNav) {
+            const slugs = [];
+            const seen = new Set();
+            for (const a of anchors) {
+              if (skipNav && a.closest('header nav, #global-nav')) continue;
+              // Skip bare /in/ and nav-only links
+              const m = SLUG_RE.exec(a.href || a.getAttribute('href') || '');
+              if (!m || m[1].length < 2 || seen.has(m[1])) continue;
+              seen.add(m[1]);
+              slugs.push(m[1]);
             }
+            return slugs;
           }
 
+          let slugs = collect(document.querySelectorAll(CARD_LINKS), false);
+
           // --- Fallback: main content /in/ links (excludes global nav) ---
-          if (!found || out.length === 0) {
+          if (slugs.length === 0) {
             const main = (
               document.querySelector('main') ||
               document.querySelector('#main-content') ||
               document.body
             );
-            // Exclude top global-nav element if present
-            const nav = document.querySelector('header nav, #global-nav');
-            main.querySelectorAll('a[href*="/in/"]').forEach(a => {
-              if (nav && nav.contains(a)) return;
-              addHref(a.href || a.getAttribute('href') || '');
-            });
+            slugs = collect(main.querySelectorAll('a[href*="/in/"]'), true);
           }
-
-          return out;
+          return slugs.map(slug => 'https://www.linkedin.com/in/' + slug + '/');
         })();
         """
         try:
@@ -448,8 +583,8 @@ class LinkedInCompanyPeopleProbe(BaseScraper):
 
     @staticmethod
     def _clean_name(name: str) -> str:
-        name = re.sub(r"\s+", " ", name or "").strip()
-        return re.sub(r"[^\w\s\-'.À-ÿ]", "", name).strip()
+        # Drop symbols first so removed emoji don't leave double spaces.
+        return _WS_RE.sub(" ", _NAME_STRIP_RE.sub("", name or "")).strip()
 
     async def find_company_url_via_browser(self, company_name: str) -> str:
         """
@@ -501,6 +636,26 @@ class LinkedInCompanyPeopleProbe(BaseScraper):
         return ""
 
 
+_domain_finder: DomainFinder | None = None
+_email_finder: AccurateEmailFinder | None = None
+_finders_lock = threading.Lock()
+
+
+def _get_finders() -> tuple[DomainFinder, AccurateEmailFinder]:
+    """
+    Finders shared by every run_probe call, so DomainFinder's per-company
+    cache and the email finder's search caches survive across probes.
+    """
+    global _domain_finder, _email_finder
+    if _email_finder is None:
+        with _finders_lock:
+            if _email_finder is None:
+                _domain_finder = DomainFinder()
+                _email_finder = AccurateEmailFinder()
+    assert _domain_finder is not None
+    return _domain_finder, _email_finder
+
+
 async def run_probe(
     company_url: str,
     limit: int = 5,
@@ -509,8 +664,7 @@ async def run_probe(
     save_notion: bool = False,
     company_name_hint: str = "",
 ) -> list[dict]:
-    with open("config/settings.yaml") as f:
-        cfg = yaml.safe_load(f)
+    cfg = load_yaml("config/settings.yaml")
     li_cfg = cfg["scraping"]["linkedin"]
     headless = False if headful else cfg["scraping"].get("headless", True)
 
@@ -546,13 +700,27 @@ async def run_probe(
                     "via HTTP search or browser fallback (tried name variants)."
                 )
 
-        company_name = await probe.get_company_name(company_url)
+        # A caller's hint names the company well enough to skip the company
+        # page load; the page <h1> is then only read if the domain lookup
+        # fails. Without a hint the page name comes first: URL slugs can be
+        # numeric ids (/company/1234567/) and lose the display casing.
+        domain_finder, finder = _get_finders()
+        company_name = (company_name_hint or "").strip()
+        page_read = False
+        if not company_name:
+            company_name = await probe.get_company_name(company_url)
+            page_read = True
         if not company_name:
             slug = company_url.rstrip("/").split("/company/")[-1].split("/")[0]
             slug = re.sub(r"[-_]+", " ", slug).strip()
             company_name = slug.title() if slug else "Unknown"
 
-        domain = domain_override or (DomainFinder().find_domain(company_name) or "")
+        domain = domain_override or (domain_finder.find_domain(company_name) or "")
+        if not domain and not page_read:
+            page_name = await probe.get_company_name(company_url)
+            if page_name and page_name.lower() != company_name.lower():
+                company_name = page_name
+                domain = domain_finder.find_domain(company_name) or ""
         if not domain:
             raise RuntimeError("Could not resolve company domain. Pass --domain explicitly.")
 
@@ -570,51 +738,77 @@ async def run_probe(
                 fallback_limit,
             )
 
-        finder = AccurateEmailFinder()
         results: list[dict] = []
         seen = set()
         max_results = limit if require_recruiter_headline else min(3, max(1, limit))
 
-        for url in profile_links:
-            if len(results) >= max_results:
-                break
-            if url in seen:
-                continue
-            seen.add(url)
+        # Email research for one profile runs on a worker thread while the
+        # browser moves on to the next profile. A single worker keeps the
+        # research quota and SMTP probes strictly sequential.
+        loop = asyncio.get_running_loop()
+        email_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="probe-email")
+        pending: list[tuple[str, str, str, asyncio.Future]] = []
+
+        async def settle_oldest() -> None:
+            name, headline, url, future = pending.pop(0)
             try:
-                profile = await probe.read_profile(url)
-                name = profile.get("name", "")
-                if not name:
+                email_result = await future
+            except Exception:
+                return
+            email = email_result.get("email", "")
+            if not email or len(results) >= max_results:
+                return
+            results.append(
+                {
+                    "name": name,
+                    "headline": headline,
+                    "linkedin_url": url,
+                    "email": email,
+                    "confidence": email_result.get("confidence", "low"),
+                    "method": email_result.get("method", ""),
+                    "company_name": company_name,
+                    "domain": domain,
+                }
+            )
+
+        try:
+            for url in profile_links:
+                # Don't read more profiles than could still be needed.
+                while pending and len(results) + len(pending) >= max_results:
+                    await settle_oldest()
+                if len(results) >= max_results:
+                    break
+                if url in seen:
                     continue
-                headline = profile.get("headline", "")
-                if require_recruiter_headline and headline and not _is_hiring_relevant_headline(headline):
-                    logger.debug(
-                        "Skipping non-recruiter/hiring profile: %s (%s)", name, headline,
+                seen.add(url)
+                try:
+                    profile = await probe.read_profile(url)
+                    name = profile.get("name", "")
+                    if not name:
+                        continue
+                    headline = profile.get("headline", "")
+                    if require_recruiter_headline and headline and not _is_hiring_relevant_headline(headline):
+                        logger.debug(
+                            "Skipping non-recruiter/hiring profile: %s (%s)", name, headline,
+                        )
+                        continue
+                    future = loop.run_in_executor(
+                        email_pool,
+                        functools.partial(
+                            finder.find_best_email,
+                            full_name=name,
+                            company_domain=domain,
+                            company_name=company_name,
+                            linkedin_url=url,
+                        ),
                     )
+                    pending.append((name, headline, url, future))
+                except Exception:
                     continue
-                email_result = finder.find_best_email(
-                    full_name=name,
-                    company_domain=domain,
-                    company_name=company_name,
-                    linkedin_url=url,
-                )
-                email = email_result.get("email", "")
-                if not email:
-                    continue
-                results.append(
-                    {
-                        "name": name,
-                        "headline": headline,
-                        "linkedin_url": url,
-                        "email": email,
-                        "confidence": email_result.get("confidence", "low"),
-                        "method": email_result.get("method", ""),
-                        "company_name": company_name,
-                        "domain": domain,
-                    }
-                )
-            except Exception:
-                continue
+            while pending:
+                await settle_oldest()
+        finally:
+            email_pool.shutdown(wait=False, cancel_futures=True)
 
         if save_notion and results:
             notion = NotionStorage()
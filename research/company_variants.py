@@ -6,6 +6,18 @@ LinkedIn/domains use "Tactful". This module provides variants so discovery
 and domain lookup can try multiple names.
 """
 
+import functools
+import re
+
+# Trailing " AI", " Inc." etc.; at most one can end a name.
+_SUFFIX_RE = re.compile(
+    r" (?:ai|ml|artificial intelligence|machine learning"
+    r"|inc|ltd|llc|co|corp|company)[.,]?$",
+    re.IGNORECASE,
+)
+# One-word names glued to "ai"/"ml", e.g. "Tactfulai".
+_GLUED_SUFFIX_RE = re.compile(r"(.+)(ai|ml)", re.IGNORECASE | re.DOTALL)
+
 
 def get_company_name_variants(company_name: str) -> list[str]:
     """
@@ -13,9 +25,14 @@ def get_company_name_variants(company_name: str) -> list[str]:
     when X uses a handle like @Tactfulai (scraped as "Tactful AI") but
     LinkedIn uses "Tactful" only. Tries: original, without trailing AI/ML/Inc, etc.
     """
-    name = (company_name or "").strip()
+    # Fresh list per call; the memoized tuple is shared.
+    return list(_variants((company_name or "").strip()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _variants(name: str) -> tuple[str, ...]:
     if not name:
-        return []
+        return ()
     seen: set[str] = set()
     out: list[str] = []
 
@@ -27,29 +44,19 @@ def get_company_name_variants(company_name: str) -> list[str]:
 
     add(name)
 
-    # "Tactful AI" / "Tactfulai" -> also try "Tactful"
-    lowered = name.lower()
-    for suffix in (
-        " ai", " ai.", " ai,", " ml", " ml.", " ml,",
-        " artificial intelligence", " machine learning",
-        " inc", " inc.", " inc,", " ltd", " ltd.", " llc", " llc.",
-        " co", " co.", " corp", " corp.", " company",
-    ):
-        if lowered.endswith(suffix.rstrip("., ")):
-            base = name[: -len(suffix.rstrip("., "))].strip()
-            if base:
-                add(base)
-                break
+    # "Tactful AI" / "Acme Inc." -> also try "Tactful" / "Acme"
+    m = _SUFFIX_RE.search(name)
+    if m:
+        add(name[: m.start()].strip())
 
     # One word ending with "ai" or "ml" (e.g. Tactfulai) -> base name
     if " " not in name and len(name) > 2:
-        for end in ("ai", "ml"):
-            if lowered.endswith(end) and len(lowered) > len(end):
-                base = name[: -len(end)].strip()
-                if base:
-                    add(base)
-                    add(base + " " + end.upper())
-                break
+        m = _GLUED_SUFFIX_RE.fullmatch(name)
+        if m:
+            base = m.group(1).strip()
+            if base:
+                add(base)
+                add(base + " " + m.group(2).upper())
 
     # "X AI" or "X ML" -> add "X"
     parts = name.split()
@@ -58,4 +65,4 @@ def get_company_name_variants(company_name: str) -> list[str]:
         if base:
             add(base)
 
-    return out
+    return tuple(out)
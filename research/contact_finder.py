@@ -11,13 +11,22 @@ Major design decisions:
    fewer than the target, a second pass accepts anyone at the company.
 """
 
+import asyncio
+import functools
 import logging
 import re
-from typing import Optional
-from urllib.parse import quote
+from typing import Callable, Optional
+from urllib.parse import quote, urlencode
+
+from playwright.async_api import Page, Response, Route
 
 from scrapers.base_scraper import BaseScraper
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 ROLE_FILTERS = [
@@ -42,6 +51,111 @@ MANAGER_FILTERS = [
     "find talent",
 ]
 
+
+
+def _build_role_matcher(filters: list[str]) -> Callable[[str], bool]:
+    """
+    Case-insensitive "title contains any filter" test, one pass per title:
+    an Aho-Corasick automaton when pyahocorasick is installed, otherwise a
+    compiled alternation.
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for f in filters:
+            automaton.add_word(f, f)
+        automaton.make_automaton()
+        return lambda title: next(automaton.iter(title.lower()), None) is not None
+    # Lowercasing once and matching case-sensitively is several times faster
+    # than an IGNORECASE alternation; the filters are already lowercase.
+    pattern = re.compile("|".join(map(re.escape, filters)))
+    return lambda title: pattern.search(title.lower()) is not None
+
+
+ROLE_MATCHER = _build_role_matcher(ROLE_FILTERS)
+MANAGER_MATCHER = _build_role_matcher(MANAGER_FILTERS)
+
+# Name and profile-slug cleanup.
+_NAME_CLEAN_RE = re.compile(r"[^\w\s\-'.À-ÿ]+")
+_WS_RE = re.compile(r"\s+")
+# ASCII-only names: delete exactly what _NAME_CLEAN_RE would, in one translate.
+_ASCII_NAME_TABLE = str.maketrans(
+    {c: None for c in map(chr, range(128)) if _NAME_CLEAN_RE.match(c)}
+)
+# Profile slug -> words: separators become spaces, digits are dropped.
+_SLUG_TRANSLATE = str.maketrans({"-": " ", "_": " ", **dict.fromkeys("0123456789", None)})
+
+
+def _canonicalize_li_url(href: str) -> str:
+    """Absolute LinkedIn URL without its query string."""
+    href = href.partition("?")[0]
+    if href.startswith("/"):
+        return f"https://www.linkedin.com{href}"
+    return href
+
+
+def _profile_key(url: str) -> str:
+    """Canonical lowercase /in/<slug> of a profile URL, or "" if it has none."""
+    _, sep, rest = url.partition("?")[0].partition("/in/")
+    if not sep:
+        return ""
+    return rest.partition("/")[0].lower()
+
+
+# People-search query per pass; pass 1 depends on the search mode.
+_PASS1_QUERIES = {
+    "managers": (
+        '"{company}" "hiring manager" OR "engineering manager" '
+        'OR "recruiter" OR "talent acquisition" OR "director of engineering"'
+    ),
+    "default": (
+        '"{company}" recruiter OR "talent acquisition" '
+        'OR "hiring manager" OR "engineering manager" OR HR'
+    ),
+}
+_LATER_PASS_QUERIES = {
+    2: '"{company}" recruiter OR "talent" OR "hiring" OR "HR"',
+    3: '"{company}" "find talent"',
+}
+_PEOPLE_SEARCH_URL = "https://www.linkedin.com/search/results/people/?"
+
+
+@functools.lru_cache(maxsize=512)
+def _build_search_url(company_name: str, mode: str, pass_num: int) -> str:
+    """LinkedIn People search URL for one pass of find_contacts."""
+    if pass_num == 1:
+        template = _PASS1_QUERIES.get(mode, _PASS1_QUERIES["default"])
+    else:
+        template = _LATER_PASS_QUERIES[pass_num]
+    params = {
+        "keywords": template.format(company=company_name),
+        "origin": "SWITCH_SEARCH_VERTICAL",
+    }
+    return _PEOPLE_SEARCH_URL + urlencode(params, quote_via=quote)
+
+
+# Parsing needs only text nodes and /in/ links; skip everything else.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+async def _block_heavy_resources(route: Route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _is_search_response(response: Response) -> bool:
+    return "voyager/api/search" in response.url
+
+
+# Result pages walked per search, one after another on the session's tab;
+# parallel navigation from one LinkedIn session trips its checkpoints.
+_MAX_RESULT_PAGES = 3
+# Cap on fallback people read from raw /in/ links per page. It applies before
+# the role filter and nav/sidebar links count against it, so keep it generous;
+# rows are small (role snippets are cut to 120 chars in the page).
+_MAX_LINK_PEOPLE = 200
+
 # Selectors to try (LinkedIn changes markup frequently)
 CARD_SELECTORS = [
     "li.reusable-search__result-container",
@@ -52,6 +166,7 @@ CARD_SELECTORS = [
     "div.search-result__wrapper",
     "li[class*='result']",
 ]
+_RESULTS_READY_SELECTOR = ", ".join(CARD_SELECTORS[:2])
 
 NAME_SELECTORS = [
     "span.entity-result__title-text a span[aria-hidden='true']",
@@ -76,6 +191,95 @@ TITLE_SELECTORS = [
     "div.search-result__info div.subline-level-1",
 ]
 
+_CHECKPOINT_MARKERS = ["checkpoint", "verify", "security verification", "unusual activity"]
+
+# Runs in the page: checkpoint flag plus a debug snippet of the body text.
+_PAGE_STATE_JS = """
+(markers) => {
+  const text = (document.body && document.body.innerText) || '';
+  const lower = text.toLowerCase();
+  return { checkpoint: markers.some(k => lower.includes(k)), snippet: text.slice(0, 500) };
+}
+"""
+
+# Every link selector requires /in/, so the first match in DOM order is as
+# good as the first by priority; title nodes are distinct per card.
+LINK_SEL_COMBINED = ", ".join(LINK_SELECTORS)
+TITLE_SEL_COMBINED = ", ".join(TITLE_SELECTORS)
+
+# Runs in the page: first card selector with matches wins, and the combined
+# card list rejects card-less pages in a single query. Within each card, link
+# and title come from one combined query each; name selectors keep their
+# priority order, since a broad fallback can hit the avatar first.
+_EXTRACT_CARDS_JS = """
+([cardSels, nameSels, linkSel, titleSel]) => {
+  if (!document.querySelector(cardSels.join(', '))) return [];
+  let cards = [];
+  for (const sel of cardSels) {
+    cards = document.querySelectorAll(sel);
+    if (cards.length) break;
+  }
+  const rows = [];
+  for (const card of cards) {
+    const link = card.querySelector(linkSel);
+    const href = link ? (link.getAttribute('href') || '') : '';
+    let name = '';
+    for (const sel of nameSels) {
+      const el = card.querySelector(sel);
+      if (!el) continue;
+      const t = (el.innerText || '').trim();
+      if (t && t.toLowerCase() !== 'linkedin member') { name = t; break; }
+    }
+    let title = '';
+    for (const el of card.querySelectorAll(titleSel)) {
+      const t = (el.innerText || '').trim();
+      if (t) { title = t; break; }
+    }
+    let first_line = '';
+    if (!name) {
+      first_line = ((card.innerText || '').trim().split('\\n')[0] || '').trim();
+    }
+    rows.push({ href, name, title, first_line });
+  }
+  return rows;
+}
+"""
+
+
+# Runs in the page: fallback people from raw /in/ links, deduped by URL, with
+# the name (visible text, else the profile slug) and a role snippet (nearby
+# text minus the name) worked out here so only short fields cross back.
+_EXTRACT_LINK_PEOPLE_JS = """
+(limit) => {
+  const nameFromSlug = (href) => {
+    const slug = href.replace(/\\/+$/, '').split('/in/').pop().split('/')[0];
+    return slug.replace(/[-_]/g, ' ').replace(/[0-9]/g, '')
+      .split(/\\s+/).filter(Boolean)
+      .map(w => w.replace(/[A-Za-z]+/g, p => p[0].toUpperCase() + p.slice(1).toLowerCase()))
+      .join(' ');
+  };
+  const seen = new Set();
+  const rows = [];
+  for (const a of document.querySelectorAll('a[href*="/in/"]')) {
+    let href = (a.getAttribute('href') || '').trim();
+    if (!href.includes('/in/')) continue;
+    if (href.startsWith('/')) href = 'https://www.linkedin.com' + href;
+    href = href.split('?')[0];
+    if (seen.has(href)) continue;
+    seen.add(href);
+
+    const name = (a.textContent || '').trim() || nameFromSlug(href);
+    if (!name) continue;
+    const container = a.closest('li, div, article, section') || a.parentElement;
+    const text = ((container && container.textContent) || '').replace(/\\s+/g, ' ').trim();
+    const role = text.split(name).join('').replace(/^[ \\-|]+|[ \\-|]+$/g, '').slice(0, 120);
+    rows.push({ href, name, role });
+    if (rows.length >= limit) break;
+  }
+  return rows;
+}
+"""
+
 
 class ContactFinder(BaseScraper):
     """Find HR/hiring contacts at a company via LinkedIn People search."""
@@ -91,6 +295,11 @@ class ContactFinder(BaseScraper):
     ):
         super().__init__(browser_data_dir, headless=headless, daily_quota=daily_quota)
         self.contacts_per_company = contacts_per_company
+        self._routes_installed = False
+        # Profile keys already returned by any find_contacts call on this
+        # instance (one pipeline run), so a profile surfacing again under
+        # another company is skipped unparsed.
+        self._run_seen: set[str] = set()
 
     async def scrape(self) -> list[dict]:
         """Not used directly; use find_contacts instead."""
@@ -108,33 +317,22 @@ class ContactFinder(BaseScraper):
         """
         if not self.check_quota():
             return []
+        await self._install_route_blockers()
 
         contacts: list[dict] = []
         seen_urls: set[str] = set()
 
         # ---- Pass 1: role-specific search ----
-        if search_mode == "managers":
-            query = (
-                f'"{company_name}" "hiring manager" OR "engineering manager" '
-                f'OR "recruiter" OR "talent acquisition" OR "director of engineering"'
-            )
-            role_filter = MANAGER_FILTERS
-        else:
-            query = (
-                f'"{company_name}" recruiter OR "talent acquisition" '
-                f'OR "hiring manager" OR "engineering manager" OR HR'
-            )
-            role_filter = ROLE_FILTERS
+        role_filter = MANAGER_MATCHER if search_mode == "managers" else ROLE_MATCHER
 
         logger.info(
             "[linkedin-people] Pass 1: role-specific search at %s (mode=%s)",
             company_name, search_mode,
         )
-        pass1 = await self._search_and_collect(
-            query, company_name, role_filter,
+        await self._search_and_collect(
+            _build_search_url(company_name, search_mode, 1), company_name, role_filter,
             contacts, seen_urls, strict_filter=True,
         )
-        contacts = pass1
 
         # ---- Pass 2: broad company search (still filtered to relevant roles) ----
         if len(contacts) < self.contacts_per_company:
@@ -142,12 +340,10 @@ class ContactFinder(BaseScraper):
                 "[linkedin-people] Pass 2: broad search for %s (have %d, need %d)",
                 company_name, len(contacts), self.contacts_per_company,
             )
-            broad_query = f'"{company_name}" recruiter OR "talent" OR "hiring" OR "HR"'
-            pass2 = await self._search_and_collect(
-                broad_query, company_name, role_filter,
+            await self._search_and_collect(
+                _build_search_url(company_name, search_mode, 2), company_name, role_filter,
                 contacts, seen_urls, strict_filter=True,
             )
-            contacts = pass2
 
         # ---- Pass 3: "find talent" keyword if still short ----
         if len(contacts) < self.contacts_per_company:
@@ -155,333 +351,308 @@ class ContactFinder(BaseScraper):
                 "[linkedin-people] Pass 3: 'find talent' search for %s (have %d, need %d)",
                 company_name, len(contacts), self.contacts_per_company,
             )
-            find_talent_query = f'"{company_name}" "find talent"'
-            pass3 = await self._search_and_collect(
-                find_talent_query, company_name, role_filter,
+            await self._search_and_collect(
+                _build_search_url(company_name, search_mode, 3), company_name, role_filter,
                 contacts, seen_urls, strict_filter=True,
             )
-            contacts = pass3
 
         logger.info(
             "[linkedin-people] Found %d contacts at %s", len(contacts), company_name,
         )
         return contacts
 
+    async def _install_route_blockers(self) -> None:
+        """Abort image/font/media/stylesheet requests for this browser context."""
+        if self._routes_installed:
+            return
+        assert self._context is not None, "Call start() first"
+        await self._context.route("**/*", _block_heavy_resources)
+        self._routes_installed = True
+
     async def _search_and_collect(
         self,
-        query: str,
+        url: str,
         company_name: str,
-        role_filter: list[str],
-        existing: list[dict],
+        role_filter: Callable[[str], bool],
+        contacts: list[dict],
         seen_urls: set[str],
         strict_filter: bool,
     ) -> list[dict]:
-        """Execute a LinkedIn People search and collect results."""
+        """Execute a LinkedIn People search, appending matches to contacts in place."""
         if not self.check_quota():
-            return existing
+            return contacts
+
+        for page_num in range(1, _MAX_RESULT_PAGES + 1):
+            if page_num == 1:
+                logger.info("[linkedin-people] Navigating to: %s", url[:120])
+                await self._load_results(self.page, url)
+            else:
+                # Only spend a quota action on the next page when there is one.
+                next_btn = await self.page.query_selector(
+                    "button.artdeco-pagination__button--next:not([disabled])"
+                )
+                if not next_btn or not self.check_quota():
+                    break
+                await self._load_results(self.page, f"{url}&page={page_num}")
 
-        encoded = quote(query)
-        url = (
-            f"https://www.linkedin.com/search/results/people/"
-            f"?keywords={encoded}&origin=SWITCH_SEARCH_VERTICAL"
-        )
+            more = await self._collect_page(
+                self.page, page_num, company_name, role_filter,
+                contacts, seen_urls, strict_filter,
+            )
+            if not more or len(contacts) >= self.contacts_per_company:
+                break
+
+        return contacts
 
-        logger.info("[linkedin-people] Navigating to: %s", url[:120])
-        await self.page.goto(url, wait_until="domcontentloaded", timeout=60_000)
-        await self.random_delay(3, 6)
+    async def _load_results(self, page: Page, url: str) -> None:
+        """Navigate the tab to a results URL and wait for cards to render."""
+        # Armed before goto so a fast search XHR is not missed.
+        search_done = asyncio.ensure_future(
+            page.wait_for_response(_is_search_response, timeout=4_000)
+        )
+        try:
+            await page.goto(url, wait_until="domcontentloaded", timeout=60_000)
+        except BaseException:
+            search_done.cancel()
+            raise
         self.increment_quota()
+        try:
+            await search_done
+        except Exception:
+            pass
+        # Short jitter so back-to-back loads don't arrive in bursts.
+        await self.random_delay(1, 2)
 
-        # Wait for results to render
-        for sel in CARD_SELECTORS[:2]:
-            try:
-                await self.page.wait_for_selector(sel, timeout=8_000)
-                break
-            except Exception:
-                continue
+        # Wait for results to render; either card selector satisfies the wait.
+        try:
+            await page.wait_for_selector(_RESULTS_READY_SELECTOR, timeout=8_000)
+        except Exception:
+            pass
 
-        contacts = list(existing)
+    def _accept(
+        self,
+        parsed: dict,
+        key: str,
+        company_name: str,
+        role_filter: Callable[[str], bool],
+        contacts: list[dict],
+        seen_urls: set[str],
+        strict_filter: bool,
+    ) -> bool:
+        """Role-filter one parsed person and append it to contacts if it passes."""
+        title = parsed.get("role_title", "")
+        if strict_filter and not self._matches_role_filter(title, role_filter):
+            return False
+        self._mark_seen(key, seen_urls)
+        parsed["company_name"] = company_name
+        contacts.append(parsed)
+        logger.info(
+            "[linkedin-people]   + %s | %s",
+            parsed.get("name", ""),
+            parsed.get("role_title", ""),
+        )
+        return True
 
-        for page_num in range(1, 4):
+    async def _collect_from_links(
+        self,
+        page: Page,
+        company_name: str,
+        role_filter: Callable[[str], bool],
+        contacts: list[dict],
+        seen_urls: set[str],
+        strict_filter: bool,
+    ) -> int:
+        """Fallback: collect from raw /in/ links. Returns how many were found."""
+        fallback_people = await self._extract_people_from_links(company_name, page)
+        for parsed in fallback_people:
             if len(contacts) >= self.contacts_per_company:
                 break
+            key = _profile_key(parsed.get("linkedin_url", ""))
+            if self._already_seen(key, seen_urls):
+                continue
+            self._accept(
+                parsed, key, company_name, role_filter, contacts, seen_urls, strict_filter,
+            )
+        return len(fallback_people)
 
-            cards = await self._find_cards()
+    async def _collect_page(
+        self,
+        page: Page,
+        page_num: int,
+        company_name: str,
+        role_filter: Callable[[str], bool],
+        contacts: list[dict],
+        seen_urls: set[str],
+        strict_filter: bool,
+    ) -> bool:
+        """
+        Collect matching people from one loaded results tab into contacts.
+        Returns False when the page had no result cards (stop paginating).
+        """
+        cards = await self._extract_cards(page)
 
-            if not cards:
-                logger.warning(
-                    "[linkedin-people] No result cards found on page %d "
-                    "(may be logged out or LinkedIn changed layout)",
-                    page_num,
-                )
-                # Detect challenge/checkpoint pages explicitly.
-                try:
-                    body = (await self.page.inner_text("body")).lower()
-                    if any(k in body for k in ["checkpoint", "verify", "security verification", "unusual activity"]):
-                        logger.warning(
-                            "[linkedin-people] LinkedIn checkpoint/verification detected. "
-                            "Session may require manual verification in non-headless mode."
-                        )
-                except Exception:
-                    pass
-
-                # Fallback extraction: parse raw /in/ links directly from page.
-                fallback_people = await self._extract_people_from_links(company_name)
-                if fallback_people:
-                    logger.info(
-                        "[linkedin-people] Fallback link extraction found %d candidates on page %d",
-                        len(fallback_people),
-                        page_num,
+        if not cards:
+            logger.warning(
+                "[linkedin-people] No result cards found on page %d "
+                "(may be logged out or LinkedIn changed layout)",
+                page_num,
+            )
+            # Detect challenge/checkpoint pages explicitly; the body text is
+            # scanned in the page and only a flag and a short snippet return.
+            try:
+                state = await page.evaluate(_PAGE_STATE_JS, _CHECKPOINT_MARKERS)
+                if state["checkpoint"]:
+                    logger.warning(
+                        "[linkedin-people] LinkedIn checkpoint/verification detected. "
+                        "Session may require manual verification in non-headless mode."
                     )
-                    for parsed in fallback_people:
-                        if len(contacts) >= self.contacts_per_company:
-                            break
-                        li_url = parsed.get("linkedin_url", "")
-                        if li_url and li_url in seen_urls:
-                            continue
-                        title = parsed.get("role_title", "")
-                        if strict_filter and not self._matches_role_filter(title, role_filter):
-                            continue
-                        if li_url:
-                            seen_urls.add(li_url)
-                        parsed["company_name"] = company_name
-                        contacts.append(parsed)
-                        logger.info(
-                            "[linkedin-people]   + %s | %s",
-                            parsed.get("name", ""),
-                            parsed.get("role_title", ""),
-                        )
-                    if len(contacts) >= self.contacts_per_company:
-                        break
-
                 # Capture the page for debugging
-                try:
-                    page_text = await self.page.inner_text("body")
-                    snippet = page_text[:500].replace("\n", " ")
-                    logger.debug("[linkedin-people] Page body snippet: %s", snippet)
-                except Exception:
-                    pass
-                break
+                logger.debug(
+                    "[linkedin-people] Page body snippet: %s",
+                    state["snippet"].replace("\n", " "),
+                )
+            except Exception:
+                pass
 
-            logger.info(
-                "[linkedin-people] Page %d: found %d cards", page_num, len(cards),
+            # Fallback extraction: parse raw /in/ links directly from page.
+            found = await self._collect_from_links(
+                page, company_name, role_filter, contacts, seen_urls, strict_filter,
             )
+            if found:
+                logger.info(
+                    "[linkedin-people] Fallback link extraction found %d candidates on page %d",
+                    found,
+                    page_num,
+                )
+            return False
 
-            parsed_on_page = 0
-            for card in cards:
-                if len(contacts) >= self.contacts_per_company:
-                    break
-
-                try:
-                    parsed = await self._parse_person_card(card)
-                    if not parsed:
-                        continue
-
-                    li_url = parsed.get("linkedin_url", "")
-                    if li_url and li_url in seen_urls:
-                        continue
-
-                    title = parsed.get("role_title", "")
+        logger.info(
+            "[linkedin-people] Page %d: found %d cards", page_num, len(cards),
+        )
 
-                    if strict_filter:
-                        if not self._matches_role_filter(title, role_filter):
-                            continue
+        parsed_on_page = 0
+        for card in cards:
+            if len(contacts) >= self.contacts_per_company:
+                break
 
-                    if li_url:
-                        seen_urls.add(li_url)
-                    parsed["company_name"] = company_name
-                    contacts.append(parsed)
+            try:
+                key = _profile_key(card.get("href") or "")
+                if self._already_seen(key, seen_urls):
+                    continue
+
+                # The role filter runs inside _card_to_person, before name cleanup.
+                parsed = self._card_to_person(card, role_filter if strict_filter else None)
+                if not parsed:
+                    continue
+
+                if self._accept(
+                    parsed, key, company_name, role_filter,
+                    contacts, seen_urls, strict_filter=False,
+                ):
                     parsed_on_page += 1
-                    logger.info(
-                        "[linkedin-people]   + %s | %s",
-                        parsed["name"], parsed["role_title"],
-                    )
 
-                except Exception as exc:
-                    logger.debug("[linkedin-people] Parse error: %s", exc)
+            except Exception as exc:
+                logger.debug("[linkedin-people] Parse error: %s", exc)
 
-            # If card parser couldn't extract anyone, fall back to raw /in/ links.
-            if parsed_on_page == 0 and len(contacts) < self.contacts_per_company:
-                fallback_people = await self._extract_people_from_links(company_name)
-                if fallback_people:
-                    logger.info(
-                        "[linkedin-people] Card parsing yielded 0; fallback extracted %d profiles",
-                        len(fallback_people),
-                    )
-                    for parsed in fallback_people:
-                        if len(contacts) >= self.contacts_per_company:
-                            break
-                        li_url = parsed.get("linkedin_url", "")
-                        if li_url and li_url in seen_urls:
-                            continue
-                        title = parsed.get("role_title", "")
-                        if strict_filter and not self._matches_role_filter(title, role_filter):
-                            continue
-                        if li_url:
-                            seen_urls.add(li_url)
-                        parsed["company_name"] = company_name
-                        contacts.append(parsed)
-                        logger.info(
-                            "[linkedin-people]   + %s | %s",
-                            parsed.get("name", ""),
-                            parsed.get("role_title", ""),
-                        )
-
-            if len(contacts) >= self.contacts_per_company:
-                break
-
-            # Try next page
-            next_btn = await self.page.query_selector(
-                "button.artdeco-pagination__button--next:not([disabled])"
+        # If card parser couldn't extract anyone, fall back to raw /in/ links.
+        if parsed_on_page == 0 and len(contacts) < self.contacts_per_company:
+            found = await self._collect_from_links(
+                page, company_name, role_filter, contacts, seen_urls, strict_filter,
             )
-            if not next_btn:
-                break
-            await next_btn.click()
-            await self.random_delay(3, 6)
-            self.increment_quota()
-
-        return contacts
+            if found:
+                logger.info(
+                    "[linkedin-people] Card parsing yielded 0; fallback extracted %d profiles",
+                    found,
+                )
+        return True
 
-    async def _find_cards(self) -> list:
-        """Try multiple CSS selectors to find result cards."""
-        for sel in CARD_SELECTORS:
-            cards = await self.page.query_selector_all(sel)
-            if cards:
-                return cards
-        return []
+    async def _extract_cards(self, page: Page) -> list[dict]:
+        """
+        Raw {href, name, title, first_line} rows for every result card, read
+        in one page.evaluate instead of several query_selector round trips
+        per card. Selector lists are tried in order exactly as before.
+        """
+        try:
+            rows = await page.evaluate(
+                _EXTRACT_CARDS_JS,
+                [CARD_SELECTORS, NAME_SELECTORS, LINK_SEL_COMBINED, TITLE_SEL_COMBINED],
+            )
+        except Exception as exc:
+            logger.debug("[linkedin-people] Card extraction failed: %s", exc)
+            return []
+        return rows or []
 
-    async def _extract_people_from_links(self, company_name: str) -> list[dict]:
+    async def _extract_people_from_links(self, company_name: str, page: Page) -> list[dict]:
         """
         Fallback parser when LinkedIn result-card selectors fail.
         Extracts /in/ links and nearby text from the page.
         """
-        script = """
-        (() => {
-          const anchors = Array.from(document.querySelectorAll('a[href*="/in/"]'));
-          const seen = new Set();
-          const rows = [];
-          for (const a of anchors) {
-            let href = a.getAttribute('href') || '';
-            if (!href.includes('/in/')) continue;
-            if (href.startsWith('/')) href = 'https://www.linkedin.com' + href;
-            href = href.split('?')[0];
-            if (seen.has(href)) continue;
-            seen.add(href);
-
-            const name = (a.textContent || '').trim();
-            const container = a.closest('li, div, article, section') || a.parentElement;
-            const text = ((container && container.textContent) || '').replace(/\\s+/g, ' ').trim();
-            rows.push({ href, name, text });
-          }
-          return rows.slice(0, 200);
-        })();
-        """
         try:
-            rows = await self.page.evaluate(script)
+            rows = await page.evaluate(_EXTRACT_LINK_PEOPLE_JS, _MAX_LINK_PEOPLE)
         except Exception:
             return []
 
-        people: list[dict] = []
-        for row in rows or []:
-            href = (row.get("href") or "").strip()
-            if not href or "/in/" not in href:
-                continue
+        return [
+            {
+                "name": row["name"],
+                "role_title": row["role"],
+                "linkedin_url": _canonicalize_li_url(row["href"]),
+                "company_name": company_name,
+            }
+            for row in rows or []
+        ]
 
-            name = (row.get("name") or "").strip()
-            text = (row.get("text") or "").strip()
-            if not name:
-                # Infer name from profile slug.
-                slug = href.rstrip("/").split("/in/")[-1]
-                slug = slug.split("/")[0]
-                slug = re.sub(r"[-_]+", " ", slug)
-                slug = re.sub(r"\d+", "", slug).strip()
-                name = slug.title() if slug else ""
-            if not name:
-                continue
+    def _already_seen(self, key: str, seen_urls: set[str]) -> bool:
+        return bool(key) and (key in seen_urls or key in self._run_seen)
 
-            # Infer role as line after name in nearby text, else fallback to text snippet.
-            role_title = ""
-            if text:
-                # Remove duplicated name in text then keep short prefix.
-                cleaned = text.replace(name, "").strip(" -|")
-                role_title = cleaned[:120]
-
-            people.append(
-                {
-                    "name": name,
-                    "role_title": role_title,
-                    "linkedin_url": href,
-                    "company_name": company_name,
-                }
-            )
+    def _mark_seen(self, key: str, seen_urls: set[str]) -> None:
+        if key:
+            seen_urls.add(key)
+            self._run_seen.add(key)
 
-        # Dedup by URL
-        dedup: dict[str, dict] = {}
-        for p in people:
-            dedup[p["linkedin_url"]] = p
-        return list(dedup.values())
-
-    async def _parse_person_card(self, card) -> Optional[dict]:
-        """Extract name, title, and profile URL from a search result card."""
-
-        # First extract URL so we can infer name from slug if needed.
-        linkedin_url = ""
-        for sel in LINK_SELECTORS:
-            el = await card.query_selector(sel)
-            if el:
-                href = await el.get_attribute("href") or ""
-                if "/in/" in href:
-                    if href.startswith("/"):
-                        href = f"https://www.linkedin.com{href}"
-                    linkedin_url = href.split("?")[0]
-                    break
+    @staticmethod
+    def _card_to_person(
+        row: dict, role_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Optional[dict]:
+        """
+        Turn one extracted card row into name, title, and profile URL.
+        With role_filter, a non-matching title returns None before any name work.
+        """
+        role_title = row.get("title") or ""
+        if role_filter is not None and not role_filter(role_title):
+            return None
+
+        linkedin_url = _canonicalize_li_url(row.get("href") or "")
 
         # ---- Name ----
-        name = ""
-        for sel in NAME_SELECTORS:
-            el = await card.query_selector(sel)
-            if el:
-                name = (await el.inner_text()).strip()
-                if name and name.lower() != "linkedin member":
-                    break
-                name = ""
+        name = row.get("name") or ""
 
         # Fallback: infer name from profile slug when visible name selector fails.
         if not name and linkedin_url:
             slug = linkedin_url.rstrip("/").split("/in/")[-1].split("/")[0]
-            slug = re.sub(r"[-_]+", " ", slug)
-            slug = re.sub(r"\d+", "", slug).strip()
+            slug = " ".join(slug.translate(_SLUG_TRANSLATE).split())
             if slug:
                 name = slug.title()
 
         if not name:
             # Last resort: first text line from the card.
-            try:
-                text = (await card.inner_text()).strip()
-                first_line = text.split("\n")[0].strip() if text else ""
-                if first_line and len(first_line) <= 80:
-                    name = first_line
-            except Exception:
-                pass
+            first_line = row.get("first_line") or ""
+            if first_line and len(first_line) <= 80:
+                name = first_line
 
         if not name:
             return None
 
         # Clean name: remove emojis, extra whitespace, accreditations
-        name = re.sub(r"[^\w\s\-'.À-ÿ]", "", name, flags=re.UNICODE).strip()
-        name = re.sub(r"\s+", " ", name)
+        if name.isascii():
+            name = name.translate(_ASCII_NAME_TABLE)
+        else:
+            name = _NAME_CLEAN_RE.sub("", name)
+        name = _WS_RE.sub(" ", name.strip())
 
         if not name or name.lower() == "linkedin member":
             return None
 
-        # ---- Role/Title ----
-        role_title = ""
-        for sel in TITLE_SELECTORS:
-            el = await card.query_selector(sel)
-            if el:
-                role_title = (await el.inner_text()).strip()
-                if role_title:
-                    break
-
         return {
             "name": name,
             "role_title": role_title,
@@ -491,11 +662,9 @@ class ContactFinder(BaseScraper):
     @staticmethod
     def _is_relevant_role(title: str) -> bool:
         """Check if the person's title matches our target roles."""
-        lower = title.lower()
-        return any(role in lower for role in ROLE_FILTERS)
+        return ROLE_MATCHER(title)
 
     @staticmethod
-    def _matches_role_filter(title: str, filters: list[str]) -> bool:
-        """Check if the person's title matches any of the given role filters."""
-        lower = title.lower()
-        return any(role in lower for role in filters)
+    def _matches_role_filter(title: str, filters: Callable[[str], bool]) -> bool:
+        """Check if the person's title matches a *_MATCHER built from a filter list."""
+        return filters(title)
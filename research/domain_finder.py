@@ -8,18 +8,29 @@ Strategies (in priority order):
 4. DNS resolution for common TLDs (with multiple slug variations)
 """
 
+import atexit
+import functools
+import json
 import re
 import logging
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
 
 import dns.resolver
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 import yaml
 
 from research.company_variants import get_company_name_variants
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - optional speedup
+    HTMLParser = None
+
 logger = logging.getLogger(__name__)
 
 HEADERS = {
@@ -29,6 +40,39 @@ HEADERS = {
     )
 }
 
+# Lookups persisted across runs: company key -> [domain or "" for a miss, stored_at].
+DOMAIN_CACHE_FILE = Path("./browser_data/quotas/domain_cache.json")
+_HIT_TTL = 30 * 86400
+_MISS_TTL = 86400
+_domain_cache: dict[str, list] | None = None
+_domain_cache_dirty = False
+
+# DNS probe candidates are resolved concurrently on one shared resolver.
+_DNS_WORKERS = 16
+_dns_pool = ThreadPoolExecutor(max_workers=_DNS_WORKERS, thread_name_prefix="dns-probe")
+
+_WWW_RE = re.compile(r"^www\.")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_URL_HOST_RE = re.compile(r"https?://([^/&?#]+)")
+
+# Search result pages are only mined for links.
+_ONLY_LINKS = SoupStrainer("a", href=True)
+
+
+def _link_tree(html: str):
+    """Parse a search page once: selectolax when installed, else lxml-backed soup."""
+    if HTMLParser is not None:
+        return HTMLParser(html)
+    return BeautifulSoup(html, "lxml", parse_only=_ONLY_LINKS)
+
+
+def _hrefs(tree, selector: str) -> Iterator[str]:
+    """hrefs of the anchors matching selector, in document order."""
+    if HTMLParser is not None:
+        return (node.attributes.get("href") or "" for node in tree.css(selector))
+    return (a_tag.get("href", "") for a_tag in tree.select(selector))
+
 SKIP_DOMAINS = {
     "google.com", "wikipedia.org", "linkedin.com", "facebook.com",
     "twitter.com", "x.com", "crunchbase.com", "glassdoor.com",
@@ -39,6 +83,70 @@ SKIP_DOMAINS = {
 }
 
 
+def _load_domain_cache() -> dict[str, list]:
+    global _domain_cache
+    if _domain_cache is None:
+        _domain_cache = {}
+        try:
+            if DOMAIN_CACHE_FILE.exists():
+                _domain_cache = json.loads(DOMAIN_CACHE_FILE.read_text())
+        except Exception as exc:
+            logger.debug("Could not read domain cache: %s", exc)
+        atexit.register(_save_domain_cache)
+    return _domain_cache
+
+
+def _save_domain_cache() -> None:
+    if not _domain_cache_dirty or _domain_cache is None:
+        return
+    try:
+        DOMAIN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DOMAIN_CACHE_FILE.write_text(json.dumps(_domain_cache))
+    except Exception as exc:
+        logger.debug("Could not write domain cache: %s", exc)
+
+
+def _stored_domain(key: str) -> Optional[str]:
+    """Persisted domain for key, "" for a remembered miss, None if absent or expired."""
+    entry = _load_domain_cache().get(key)
+    if not entry:
+        return None
+    domain, stored_at = entry
+    if time.time() - stored_at > (_HIT_TTL if domain else _MISS_TTL):
+        return None
+    return domain
+
+
+def _store_domain(key: str, domain: Optional[str]) -> None:
+    global _domain_cache_dirty
+    _load_domain_cache()[key] = [domain or "", time.time()]
+    _domain_cache_dirty = True
+
+
+class _SearchFailed(Exception):
+    """A search request errored or was refused, as opposed to finding nothing."""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_resolver() -> dns.resolver.Resolver:
+    """
+    Shared resolver, built on first use. Construction reads /etc/resolv.conf,
+    so doing it at import time would break importing this module on hosts
+    without one; here the error surfaces as a failed lookup instead.
+    """
+    resolver = dns.resolver.Resolver()
+    resolver.lifetime = 3.0
+    return resolver
+
+
+def _resolves(hostname: str) -> bool:
+    try:
+        _get_resolver().resolve(hostname, "A")
+        return True
+    except Exception:
+        return False
+
+
 class DomainFinder:
     def __init__(self):
         with open("config/settings.yaml") as f:
@@ -54,24 +162,43 @@ class DomainFinder:
         key = company_name.strip().lower()
         if key in self._cache:
             return self._cache[key]
+        stored = _stored_domain(key)
+        if stored:
+            self._cache[key] = stored
+            return stored
 
         domain = None
 
-        # Strategy 1: Use domain_hint from the post
+        # Strategy 1: Use domain_hint from the post (even over a remembered miss)
         if domain_hint:
             domain = self._validate_domain_hint(domain_hint, company_name)
             if domain:
                 logger.info("Domain for '%s' via hint: %s", company_name, domain)
 
+        if not domain and stored == "":
+            return None
+
+        # A miss is only persisted when every search actually ran; a network
+        # error or rate limit must not hide the company across runs.
+        search_failed = False
+
+        def search(fn, name: str) -> Optional[str]:
+            nonlocal search_failed
+            try:
+                return fn(name)
+            except _SearchFailed:
+                search_failed = True
+                return None
+
         # Strategy 2: DuckDuckGo (doesn't block like Google)
         if not domain:
-            domain = self._duckduckgo_search(company_name)
+            domain = search(self._duckduckgo_search, company_name)
             if domain:
                 logger.info("Domain for '%s' via DuckDuckGo: %s", company_name, domain)
 
         # Strategy 3: Google search
         if not domain:
-            domain = self._google_search(company_name)
+            domain = search(self._google_search, company_name)
             if domain:
                 logger.info("Domain for '%s' via Google: %s", company_name, domain)
 
@@ -89,7 +216,10 @@ class DomainFinder:
                 if vkey in self._cache:
                     domain = self._cache[vkey]
                     break
-                domain = self._duckduckgo_search(variant) or self._google_search(variant)
+                domain = (
+                    search(self._duckduckgo_search, variant)
+                    or search(self._google_search, variant)
+                )
                 if not domain:
                     domain = self._dns_probe(variant)
                 if domain:
@@ -98,27 +228,31 @@ class DomainFinder:
                         company_name, variant, domain,
                     )
                     self._cache[vkey] = domain
+                    _store_domain(vkey, domain)
                     break
 
         if domain:
             self._cache[key] = domain
+            _store_domain(key, domain)
         else:
             logger.warning("Could not find domain for '%s'", company_name)
+            if not search_failed:
+                _store_domain(key, None)
 
         return domain
 
     def _validate_domain_hint(self, hint: str, company_name: str) -> Optional[str]:
         """Verify the domain hint resolves and loosely relates to the company."""
         hint = hint.lower().strip()
-        hint = re.sub(r"^www\.", "", hint)
+        hint = _WWW_RE.sub("", hint)
 
         try:
             dns.resolver.resolve(hint, "A")
         except Exception:
             return None
 
-        slug = re.sub(r"[^a-z0-9]", "", company_name.lower())
-        domain_slug = re.sub(r"[^a-z0-9]", "", hint.split(".")[0])
+        slug = _NON_ALNUM_RE.sub("", company_name.lower())
+        domain_slug = _NON_ALNUM_RE.sub("", hint.split(".")[0])
 
         if len(slug) >= 3 and (domain_slug in slug or slug in domain_slug):
             return hint
@@ -139,19 +273,17 @@ class DomainFinder:
             resp.raise_for_status()
         except Exception as exc:
             logger.debug("DuckDuckGo search failed: %s", exc)
-            return None
+            raise _SearchFailed(str(exc)) from exc
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        tree = _link_tree(resp.text)
 
-        for a_tag in soup.select("a.result__a[href]"):
-            href = a_tag.get("href", "")
+        for href in _hrefs(tree, "a.result__a[href]"):
             domain = self._extract_domain_from_url(href)
             if domain and not self._is_skip_domain(domain):
                 return domain
 
         # Also try result snippets for URLs
-        for a_tag in soup.select("a[href]"):
-            href = a_tag.get("href", "")
+        for href in _hrefs(tree, "a[href]"):
             domain = self._extract_domain_from_url(href)
             if domain and not self._is_skip_domain(domain):
                 return domain
@@ -168,12 +300,9 @@ class DomainFinder:
             resp.raise_for_status()
         except Exception as exc:
             logger.debug("Google search failed: %s", exc)
-            return None
+            raise _SearchFailed(str(exc)) from exc
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        for a_tag in soup.select("a[href]"):
-            href = a_tag["href"]
+        for href in _hrefs(_link_tree(resp.text), "a[href]"):
             domain = self._extract_domain_from_url(href)
             if domain and not self._is_skip_domain(domain):
                 return domain
@@ -187,44 +316,51 @@ class DomainFinder:
         E.g. "Scale AI" -> tries: scaleai.com, scale.com, scale.ai, scale-ai.com, etc.
         """
         name = company_name.lower().strip()
-        words = re.findall(r"[a-z0-9]+", name)
+        words = _WORD_RE.findall(name)
         if not words:
             return None
 
-        # Build slug variations
-        slugs = set()
-        # All words joined: "scaleai"
-        slugs.add("".join(words))
-        # First word only: "scale"
-        slugs.add(words[0])
-        # Hyphenated: "scale-ai"
+        # Build slug variations, in priority order
+        slugs = [
+            # All words joined: "scaleai"
+            "".join(words),
+            # First word only: "scale"
+            words[0],
+        ]
         if len(words) > 1:
-            slugs.add("-".join(words))
-        # First two words: "openai"
-        if len(words) >= 2:
-            slugs.add(words[0] + words[1])
-
-        for slug in slugs:
-            if not slug or len(slug) < 2:
-                continue
-            for tld in self.tlds:
-                candidate = f"{slug}{tld}"
-                try:
-                    dns.resolver.resolve(candidate, "A")
+            # Hyphenated: "scale-ai"
+            slugs.append("-".join(words))
+            # First two words: "openai"
+            slugs.append(words[0] + words[1])
+
+        candidates = [
+            f"{slug}{tld}"
+            for slug in dict.fromkeys(slugs)
+            if len(slug) >= 2
+            for tld in self.tlds
+        ]
+
+        # Resolve every candidate at once; the first success in priority
+        # order wins, so wall time is about one lookup instead of the sum.
+        futures = [_dns_pool.submit(_resolves, c) for c in candidates]
+        try:
+            for candidate, future in zip(candidates, futures):
+                if future.result():
                     return candidate
-                except Exception:
-                    continue
+        finally:
+            for future in futures:
+                future.cancel()
 
         return None
 
     @staticmethod
     def _extract_domain_from_url(url_or_href: str) -> Optional[str]:
         """Extract a clean domain from a URL string."""
-        match = re.search(r"https?://([^/&?#]+)", url_or_href)
+        match = _URL_HOST_RE.search(url_or_href)
         if not match:
             return None
         domain = match.group(1).lower()
-        domain = re.sub(r"^www\.", "", domain)
+        domain = _WWW_RE.sub("", domain)
         if "." in domain:
             return domain
         return None
@@ -23,7 +23,8 @@ from typing import Optional
 import dns.resolver
 import requests
 from bs4 import BeautifulSoup
-import yaml
+
+from config.loader import load_yaml
 
 logger = logging.getLogger(__name__)
 
@@ -46,10 +47,8 @@ class EmailFinder:
     """Multi-strategy email finder. Always returns a best-guess when possible."""
 
     def __init__(self):
-        with open("config/email_patterns.yaml") as f:
-            self.patterns = yaml.safe_load(f)["patterns"]
-        with open("config/settings.yaml") as f:
-            cfg = yaml.safe_load(f)
+        self.patterns = load_yaml("config/email_patterns.yaml")["patterns"]
+        cfg = load_yaml("config/settings.yaml")
         self.smtp_delay = cfg["research"]["email_smtp_delay"]
         self.smtp_enabled = cfg["research"].get("smtp_verify_enabled", True)
 
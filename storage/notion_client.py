@@ -10,6 +10,9 @@ first data source from each database and use it for all property / page ops.
 import os
 import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -17,6 +20,42 @@ from notion_client import Client
 
 logger = logging.getLogger(__name__)
 
+# Notion rate-limits integrations to ~3 requests/second. The workers only
+# overlap request latency; _archive_limiter enforces the actual rate.
+_ARCHIVE_WORKERS = 3
+_NOTION_RPS = 3.0
+# Attempts per page when Notion answers 429 (honouring Retry-After).
+_ARCHIVE_ATTEMPTS = 3
+
+
+class _RateLimiter:
+    """Spaces call starts at least 1/rate seconds apart, across threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_archive_limiter = _RateLimiter(_NOTION_RPS)
+
+
+def _retry_after(exc: Exception) -> float:
+    """Seconds to wait from a 429's Retry-After header (1s if absent)."""
+    headers = getattr(exc, "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after", 1)))
+    except (TypeError, ValueError):
+        return 1.0
+
 
 def _hash_fingerprint(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
@@ -189,10 +228,24 @@ class NotionStorage:
     # Clear
     # ------------------------------------------------------------------
 
+    def _archive_page(self, page_id: str) -> bool:
+        for attempt in range(1, _ARCHIVE_ATTEMPTS + 1):
+            _archive_limiter.wait()
+            try:
+                self.client.pages.update(page_id=page_id, archived=True)
+                return True
+            except Exception as exc:
+                if getattr(exc, "status", None) == 429 and attempt < _ARCHIVE_ATTEMPTS:
+                    time.sleep(_retry_after(exc))
+                    continue
+                logger.debug("Could not archive page %s: %s", page_id, exc)
+                return False
+        return False
+
     def _clear_database(self, database_id: str, label: str) -> int:
         if not database_id:
             return 0
-        total = 0
+        page_ids: list[str] = []
         start_cursor: Optional[str] = None
         try:
             while True:
@@ -202,20 +255,28 @@ class NotionStorage:
                 resp = self._query_data_source(database_id, **kwargs)
                 for page in resp.get("results", []):
                     page_id = page.get("id")
-                    if not page_id:
-                        continue
-                    try:
-                        self.client.pages.update(page_id=page_id, archived=True)
-                        total += 1
-                    except Exception as exc:
-                        logger.debug("Could not archive page %s: %s", page_id, exc)
+                    if page_id:
+                        page_ids.append(page_id)
                 if not resp.get("has_more"):
                     break
                 start_cursor = resp.get("next_cursor")
-            if total > 0:
-                logger.info("Cleared %s: archived %d page(s).", label, total)
         except Exception as exc:
             logger.warning("Could not clear %s: %s", label, exc)
+
+        # Archive on a few threads; _archive_limiter keeps the request rate
+        # within Notion's ~3 requests/second and 429s are retried.
+        total = 0
+        if page_ids:
+            with ThreadPoolExecutor(max_workers=_ARCHIVE_WORKERS) as pool:
+                total = sum(pool.map(self._archive_page, page_ids))
+        if total > 0:
+            logger.info("Cleared %s: archived %d page(s).", label, total)
+        failed = len(page_ids) - total
+        if failed:
+            logger.warning(
+                "Could not archive %d of %d %s page(s); they remain in Notion.",
+                failed, len(page_ids), label,
+            )
         return total
 
     def clear_all_tables(self) -> None:
@@ -0,0 +1,56 @@
+import re
+
+from outreach.sender import EmailSender, _header_value
+
+LONG_SUBJECT = "Congrats on the Series A — quick question about your ML team at Acme"
+BARE_LF = re.compile(rb"(?<!\r)\n")
+
+
+def test_folded_header_uses_crlf():
+    value = _header_value(LONG_SUBJECT)
+    assert "\n" in value  # long enough to fold
+    assert not BARE_LF.search(value.encode())
+
+
+def test_wire_has_no_bare_lf(monkeypatch, tmp_path):
+    monkeypatch.setattr("outreach.sender.QUOTA_FILE", tmp_path / "quota.json")
+    monkeypatch.setenv("GMAIL_EMAIL", "me@example.com")
+    monkeypatch.setenv("GMAIL_APP_PASSWORD", "x")
+    monkeypatch.setenv("YOUR_NAME", "Zoë Exämple")
+    sender = EmailSender()
+    wire = sender.build_wire("to@example.com", LONG_SUBJECT, "Hi,\nline two\n")
+    assert not BARE_LF.search(wire)
+
+
+def test_quota_resets_when_date_changes(monkeypatch, tmp_path):
+    import json
+    from datetime import date
+
+    import outreach.sender as sender_mod
+
+    quota_file = tmp_path / "quota.json"
+    monkeypatch.setattr(sender_mod, "QUOTA_FILE", quota_file)
+    monkeypatch.setenv("GMAIL_EMAIL", "me@example.com")
+    monkeypatch.setenv("GMAIL_APP_PASSWORD", "x")
+
+    class FakeDate(date):
+        current = date(2026, 1, 1)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(sender_mod, "date", FakeDate)
+    sender = EmailSender()
+    for _ in range(sender.max_per_day):
+        sender.record_sent("to@example.com")
+    assert not sender.can_send()
+    assert json.loads(quota_file.read_text())["date"] == "2026-01-01"
+
+    FakeDate.current = date(2026, 1, 2)
+    assert sender.can_send()
+    assert sender.remaining_today() == sender.max_per_day
+
+    sender.record_sent("to@example.com")
+    sender.close()
+    assert json.loads(quota_file.read_text()) == {"date": "2026-01-02", "count": 1}